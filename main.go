@@ -333,17 +333,17 @@ func (m model) handleEnter() (tea.Model, tea.Cmd) {
 				m.errMsg = ""
 				// Determine which stage to resume from
 				resumeStage := stageImport
-				if _, err := os.Stat(filepath.Join(m.workDir, "cleaned_emails.json")); err == nil {
+				if stageComplete(m.workDir, "cleaned_emails.jsonl", m.sender) {
 					resumeStage = stageCurate
 					// Mark prior stages as complete
 					m.stageStats[stageImport] = map[string]int{"resumed": 1}
 					m.stageStats[stageConvert] = map[string]int{"resumed": 1}
 					m.stageStats[stageClean] = map[string]int{"resumed": 1}
-				} else if _, err := os.Stat(filepath.Join(m.workDir, "emails.jsonl")); err == nil {
+				} else if stageComplete(m.workDir, "emails.jsonl", m.sender) {
 					resumeStage = stageClean
 					m.stageStats[stageImport] = map[string]int{"resumed": 1}
 					m.stageStats[stageConvert] = map[string]int{"resumed": 1}
-				} else if _, err := os.Stat(filepath.Join(m.workDir, "emails_raw.json")); err == nil {
+				} else if stageComplete(m.workDir, "emails_raw.json", m.sender) {
 					resumeStage = stageConvert
 					m.stageStats[stageImport] = map[string]int{"resumed": 1}
 				}
@@ -781,9 +781,9 @@ func getIncompleteJob() *Job {
 		if _, err := os.Stat(filepath.Join(job.WorkDir, "style_shortlist.csv")); err == nil {
 			continue
 		}
-		// Check for intermediate files
-		for _, f := range []string{"emails_raw.json", "emails.jsonl", "cleaned_emails.json"} {
-			if _, err := os.Stat(filepath.Join(job.WorkDir, f)); err == nil {
+		// Check for intermediate files with an intact manifest for this sender
+		for _, f := range []string{"emails_raw.json", "emails.jsonl", "cleaned_emails.jsonl"} {
+			if stageComplete(job.WorkDir, f, job.Sender) {
 				return &job
 			}
 		}
@@ -791,6 +791,37 @@ func getIncompleteJob() *Job {
 	return nil
 }
 
+// stageManifest is the subset of pipeline.py's <output>.manifest.json we check
+type stageManifest struct {
+	Records    int                    `json:"records"`
+	OutputSize int64                  `json:"output_size"`
+	Params     map[string]interface{} `json:"params"`
+}
+
+// stageComplete reports whether a stage output in workDir was fully written
+// (its size matches the manifest) for the given sender
+func stageComplete(workDir, name, sender string) bool {
+	data, err := os.ReadFile(filepath.Join(workDir, name+".manifest.json"))
+	if err != nil {
+		return false
+	}
+	var mf stageManifest
+	if err := json.Unmarshal(data, &mf); err != nil {
+		return false
+	}
+	info, err := os.Stat(filepath.Join(workDir, name))
+	if err != nil || info.Size() != mf.OutputSize {
+		return false
+	}
+	if s, ok := mf.Params["sender"]; ok {
+		got, _ := s.(string)
+		if got != strings.ToLower(sender) {
+			return false
+		}
+	}
+	return true
+}
+
 func markJobComplete(workDir string) {
 	jobs := loadJobs()
 	now := time.Now().UTC().Format(time.RFC3339)
@@ -951,6 +982,9 @@ func runPipelineStage(inputFile, sender, workDir string, s stage) tea.Cmd {
 		switch s {
 		case stageImport:
 			args = []string{pipelineScript, "import", inputFile, "--out", "emails_raw.json", "--json-stats"}
+			if sender != "" {
+				args = append(args, "--sender", sender)
+			}
 		case stageConvert:
 			// Use emails_raw.json if it exists, otherwise use inputFile
 			convertInput := filepath.Join(workDir, "emails_raw.json")
@@ -959,12 +993,12 @@ func runPipelineStage(inputFile, sender, workDir string, s stage) tea.Cmd {
 			}
 			args = []string{pipelineScript, "convert", convertInput, "--out", "emails.jsonl", "--json-stats"}
 		case stageClean:
-			args = []string{pipelineScript, "clean", "emails.jsonl", "--out", "cleaned_emails.json", "--json-stats"}
+			args = []string{pipelineScript, "clean", "emails.jsonl", "--out", "cleaned_emails.jsonl", "--json-stats"}
 			if sender != "" {
 				args = append(args, "--sender", sender)
 			}
 		case stageCurate:
-			args = []string{pipelineScript, "curate", "cleaned_emails.json", "--out", "style_shortlist.csv", "--json-stats"}
+			args = []string{pipelineScript, "curate", "cleaned_emails.jsonl", "--out", "style_shortlist.csv", "--json-stats"}
 		}
 
 		cmd := exec.Command(python, args...)
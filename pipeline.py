@@ -16,16 +16,24 @@ Can be used as a library or run directly with subcommands.
 import argparse
 import csv
 import hashlib
+import email
+import gzip
+import heapq
+import itertools
 import json
-import mailbox
+import mmap
 import os
 import re
+import struct
 import sys
+import tempfile
+import weakref
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime, timezone, timedelta
 from email import policy
 from email.utils import getaddresses, parseaddr
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 # =============================================================================
 # STAGE 0: MBOX IMPORT (Google Takeout)
@@ -91,10 +99,76 @@ def extract_body_from_message(msg) -> Tuple[str, str]:
     return plain_body, html_body
 
 
+TAKEOUT_PART_RE = re.compile(r"^(takeout-.*-)\d{3}\.zip$", re.IGNORECASE)
+ZIP_MEMBER_RE = re.compile(r"^(.*?\.zip)[/\\](.+)$", re.IGNORECASE)
+
+
+def _zip_parts(zip_path: str) -> List[str]:
+    """Return every part of a split Takeout export (takeout-*-001.zip, -002.zip, ...)."""
+    import glob
+
+    directory, name = os.path.split(zip_path)
+    m = TAKEOUT_PART_RE.match(name)
+    if not m:
+        return [zip_path]
+    pattern = os.path.join(glob.escape(directory), glob.escape(m.group(1)) + "[0-9][0-9][0-9].zip")
+    parts = sorted(glob.glob(pattern))
+    return parts or [zip_path]
+
+
+def split_zip_member(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a "<archive>.zip/<member>" path into (archive, member).
+
+    find_mbox_files returns paths in this form for MBOX files inside a ZIP,
+    so they can be read in place. Returns None for ordinary paths.
+    """
+    if os.path.exists(path):
+        return None
+    m = ZIP_MEMBER_RE.match(path)
+    if not m or not os.path.isfile(m.group(1)):
+        return None
+    return m.group(1), m.group(2).replace("\\", "/")
+
+
+def open_mbox_source(path: str):
+    """Open an MBOX file, or an MBOX member inside a ZIP, for binary reading."""
+    import zipfile
+
+    member = split_zip_member(path)
+    if member is None:
+        return open(path, "rb")
+    zf = zipfile.ZipFile(member[0])
+    try:
+        f = zf.open(member[1])
+    except Exception:
+        zf.close()
+        raise
+    # ZipExtFile keeps its own handle on the archive once opened
+    zf.close()
+    return f
+
+
+def mbox_source_size(path: str) -> int:
+    """Uncompressed size of an MBOX file or ZIP member, in bytes."""
+    import zipfile
+
+    member = split_zip_member(path)
+    if member is None:
+        return os.path.getsize(path)
+    with zipfile.ZipFile(member[0]) as zf:
+        return zf.getinfo(member[1]).file_size
+
+
 def find_mbox_files(input_path: str, quiet: bool = False) -> List[str]:
     """
     Find all MBOX files from a path (file, directory, or zip).
 
+    ZIP files are not extracted: MBOX members are returned as
+    "<archive>.zip/<member>" paths and streamed straight out of the archive
+    (ZIP64 included). For split Takeout exports, pointing at any
+    takeout-*-NNN.zip part picks up every part in the set.
+
     Args:
         input_path: Path to MBOX file, directory, or zip file
         quiet: If True, suppress progress output
@@ -103,7 +177,6 @@ def find_mbox_files(input_path: str, quiet: bool = False) -> List[str]:
         List of paths to MBOX files
     """
     import glob
-    import tempfile
     import zipfile
 
     input_path = os.path.abspath(input_path)
@@ -114,23 +187,34 @@ def find_mbox_files(input_path: str, quiet: bool = False) -> List[str]:
             print(f"📄 Found single MBOX file")
         return [input_path]
 
-    # Case 2: ZIP file (Google Takeout export)
+    # Case 2: ZIP file (Google Takeout export) - read members in place
     if os.path.isfile(input_path) and input_path.lower().endswith('.zip'):
+        parts = _zip_parts(input_path)
         if not quiet:
-            print(f"📦 Extracting ZIP file: {os.path.basename(input_path)}")
-
-        # Extract to a directory next to the zip
-        extract_dir = input_path.rsplit('.', 1)[0] + "_extracted"
-        os.makedirs(extract_dir, exist_ok=True)
+            if len(parts) > 1:
+                print(f"📦 Reading {len(parts)}-part ZIP export in place: {os.path.basename(input_path)}")
+            else:
+                print(f"📦 Reading ZIP file in place: {os.path.basename(input_path)}")
 
-        with zipfile.ZipFile(input_path, 'r') as zf:
-            zf.extractall(extract_dir)
+        mbox_files = []
+        for part in parts:
+            with zipfile.ZipFile(part) as zf:
+                members = sorted(
+                    info.filename for info in zf.infolist()
+                    if not info.is_dir() and info.filename.lower().endswith('.mbox')
+                )
+            mbox_files.extend(os.path.join(part, member) for member in members)
 
         if not quiet:
-            print(f"📂 Extracted to: {extract_dir}")
+            if len(mbox_files) == 0:
+                print(f"⚠️  No .mbox files found in: {os.path.basename(input_path)}")
+            else:
+                print(f"📚 Found {len(mbox_files)} MBOX file(s):")
+                for f in mbox_files:
+                    size_mb = mbox_source_size(f) / (1024 * 1024)
+                    print(f"   └── {os.path.relpath(f, os.path.dirname(input_path))} ({size_mb:.1f} MB)")
 
-        # Now search the extracted directory
-        input_path = extract_dir
+        return mbox_files
 
     # Case 3: Directory - glob for all MBOX files
     if os.path.isdir(input_path):
@@ -160,6 +244,328 @@ def find_mbox_files(input_path: str, quiet: bool = False) -> List[str]:
     return []
 
 
+# Byte ranges handed to each import worker when splitting a large MBOX
+IMPORT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def split_mbox_ranges(input_path: str, chunk_bytes: int = IMPORT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split an MBOX file into (start, end) byte ranges of roughly chunk_bytes.
+
+    Every range after the first begins on a "From " separator line, so each
+    range can be parsed independently and concatenating the results gives
+    the same messages, in the same order, as reading the whole file.
+    """
+    size = os.path.getsize(input_path)
+    points = [0]
+
+    if size:
+        with open(input_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            target = chunk_bytes
+            while target < size:
+                # First separator line starting at or after target
+                pos = mm.find(b"\nFrom ", target - 1)
+                if pos < 0:
+                    break
+                points.append(pos + 1)
+                target = pos + 1 + chunk_bytes
+
+    points.append(size)
+    return list(zip(points, points[1:]))
+
+
+def _iter_mbox_spans(mm, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of each message between two byte offsets.
+
+    Follows mailbox.mbox conventions: messages start at lines beginning with
+    "From " (the separator line itself is not included), anything before the
+    first separator is ignored, and the blank line preceding the next
+    separator is dropped.
+    """
+    if mm[start:start + 5] == b"From " and (start == 0 or mm[start - 1:start] == b"\n"):
+        sep = start
+    else:
+        sep = mm.find(b"\nFrom ", start, end)
+        sep = sep + 1 if sep >= 0 else -1
+
+    while sep >= 0:
+        msg_start = mm.find(b"\n", sep, end)
+        msg_start = msg_start + 1 if msg_start >= 0 else end
+
+        nxt = mm.find(b"\nFrom ", msg_start - 1, end)
+        if nxt < 0:
+            msg_end = end
+            sep = -1
+        else:
+            msg_end = sep = nxt + 1
+
+        # A trailing blank line belongs to the separator, not the message
+        if msg_end > msg_start and mm[msg_end - 1:msg_end] == b"\n" and \
+                (msg_end - 1 == msg_start or mm[msg_end - 2:msg_end - 1] == b"\n"):
+            msg_end -= 1
+
+        yield msg_start, msg_end
+
+
+# Header block ends at the first line that is not a header or continuation
+# (the same rule the email parser uses - normally the blank line)
+HEADER_END_RE = re.compile(rb"^(?![\x21-\x39\x3b-\x7e]*:|[ \t])", re.MULTILINE)
+RAW_LABELS_RE = re.compile(rb"^X-Gmail-Labels:[ \t]*(.*(?:\r?\n[ \t].*)*)", re.MULTILINE | re.IGNORECASE)
+RAW_DATE_RE = re.compile(rb"^Date:[ \t]*(.*(?:\r?\n[ \t].*)*)", re.MULTILINE | re.IGNORECASE)
+RAW_FROM_RE = re.compile(rb"^From:[ \t]*(.*(?:\r?\n[ \t].*)*)", re.MULTILINE | re.IGNORECASE)
+RAW_MESSAGE_ID_RE = re.compile(rb"^Message-ID:[ \t]*(.*(?:\r?\n[ \t].*)*)", re.MULTILINE | re.IGNORECASE)
+
+
+def _raw_header(regex, mm, start: int, end: int) -> str:
+    """Return the first matching header value from a raw header block."""
+    m = regex.search(mm, start, end)
+    if not m:
+        return ""
+    return m.group(1).decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+def normalize_message_id(value: Any) -> str:
+    """Message-ID with header folding and surrounding whitespace removed."""
+    return " ".join(str(value or "").split())
+
+
+def _is_spam_trash(labels: str) -> bool:
+    label_list = [l.strip().lower() for l in labels.split(",")]
+    return "spam" in label_list or "trash" in label_list or "draft" in label_list or "drafts" in label_list
+
+
+def _is_other_sender(from_addr: str, sender_email: Optional[str]) -> bool:
+    """Sender check, matching the From address the same way clean_emails does."""
+    if not sender_email:
+        return False
+    return parseaddr(from_addr)[1].lower() != sender_email.lower()
+
+
+def _is_too_old(date: str, cutoff_date: datetime) -> bool:
+    from email.utils import parsedate_to_datetime
+
+    if not date:
+        return False
+    try:
+        msg_date = parsedate_to_datetime(date)
+        if msg_date.tzinfo is None:
+            msg_date = msg_date.replace(tzinfo=timezone.utc)
+        return msg_date < cutoff_date
+    except Exception:
+        return False  # If date parsing fails, keep the message
+
+
+def _prefilter_headers(
+    mm,
+    start: int,
+    end: int,
+    cutoff_date: datetime,
+    sender_email: Optional[str] = None,
+    skip_message_ids: Optional[Set[str]] = None
+) -> Optional[str]:
+    """
+    Apply the import filters to a message's raw header bytes.
+
+    Returns the stats key the message should be counted under if it can be
+    dropped without a full MIME parse, or None if it has to be parsed.
+    """
+    m = HEADER_END_RE.search(mm, start, end)
+    header_end = m.start() if m else end
+
+    if _is_spam_trash(_raw_header(RAW_LABELS_RE, mm, start, header_end)):
+        return "spam_trash"
+    if _is_too_old(_raw_header(RAW_DATE_RE, mm, start, header_end), cutoff_date):
+        return "too_old"
+    if _is_other_sender(_raw_header(RAW_FROM_RE, mm, start, header_end), sender_email):
+        return "skipped_sender"
+    if skip_message_ids:
+        msg_id = normalize_message_id(_raw_header(RAW_MESSAGE_ID_RE, mm, start, header_end))
+        if msg_id and msg_id in skip_message_ids:
+            return "already_seen"
+    return None
+
+
+def _iter_mbox_blocks(f, block_bytes: int = IMPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Read an MBOX stream in blocks of roughly block_bytes.
+
+    Each block ends just before a "From " separator line (or at end of
+    stream), so blocks can be parsed independently with the same results as
+    parsing the whole stream.
+    """
+    buf = b""
+    while True:
+        data = f.read(block_bytes)
+        if not data:
+            if buf:
+                yield buf
+            return
+        buf += data
+        cut = buf.rfind(b"\nFrom ")
+        if cut >= 0:
+            yield buf[:cut + 1]
+            buf = buf[cut + 1:]
+
+
+def _iter_mbox_buffer(
+    buf,
+    start: int,
+    end: int,
+    stats: Dict[str, int],
+    cutoff_date: datetime,
+    quiet: bool = False,
+    sender_email: Optional[str] = None,
+    skip_message_ids: Optional[Set[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Parse the messages in buf[start:end] (an mmap or bytes) into email dicts."""
+    for msg_start, msg_end in _iter_mbox_spans(buf, start, end):
+        stats["total"] += 1
+
+        if not quiet and stats["total"] % 100 == 0:
+            print(f"      Processed {stats['total']} messages...", flush=True)
+
+        # Cheap header-only filters first: spam, trash, drafts, old mail,
+        # other senders and already-seen messages never pay for a full MIME parse
+        rejected = _prefilter_headers(buf, msg_start, msg_end, cutoff_date, sender_email, skip_message_ids)
+        if rejected:
+            stats[rejected] += 1
+            continue
+
+        record = _parse_mbox_message(buf[msg_start:msg_end], cutoff_date, stats, quiet, sender_email)
+        if record is None:
+            continue
+
+        stats["imported"] += 1
+        yield record
+
+
+def iter_mbox_single(
+    input_path: str,
+    stats: Dict[str, int],
+    quiet: bool = False,
+    max_age_years: int = 5,
+    start: int = 0,
+    end: Optional[int] = None,
+    sender_email: Optional[str] = None,
+    skip_message_ids: Optional[Set[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream email dicts from a single MBOX file, one message at a time.
+
+    Counters in `stats` (total, imported, skipped, spam_trash, too_old,
+    skipped_sender, already_seen) are updated in place as messages are read, so callers
+    can write each record out immediately without holding the whole
+    mailbox in memory.
+
+    The file is memory-mapped and scanned with byte-level searches. Label,
+    age and sender filters run against the raw header block first; only
+    messages that survive are copied out and given a full MIME parse.
+    MBOX members of a ZIP ("<archive>.zip/<member>") are decompressed as a
+    stream in message-aligned blocks instead.
+
+    Args:
+        start, end: Optional byte range to read (see split_mbox_ranges;
+            plain files only)
+        sender_email: Only keep messages whose From address matches
+        skip_message_ids: Normalized Message-IDs to drop before parsing
+            (see normalize_message_id; used by incremental runs)
+
+    Yields:
+        Email dicts
+    """
+    for key in ("total", "imported", "skipped", "spam_trash", "too_old", "skipped_sender", "already_seen"):
+        stats.setdefault(key, 0)
+
+    # Calculate cutoff date
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_years * 365)
+
+    if split_zip_member(input_path):
+        with open_mbox_source(input_path) as f:
+            for block in _iter_mbox_blocks(f):
+                yield from _iter_mbox_buffer(block, 0, len(block), stats, cutoff_date, quiet, sender_email,
+                                             skip_message_ids)
+        return
+
+    with open(input_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size if end is None else end
+            yield from _iter_mbox_buffer(mm, start, end, stats, cutoff_date, quiet, sender_email,
+                                         skip_message_ids)
+
+
+def _parse_mbox_message(
+    raw: bytes,
+    cutoff_date: datetime,
+    stats: Dict[str, int],
+    quiet: bool = False,
+    sender_email: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Fully parse one raw message into an email dict.
+
+    Returns None (after bumping the matching counter in `stats`) when the
+    message is filtered out or cannot be parsed.
+    """
+    try:
+        message = email.message_from_bytes(raw)
+
+        # Gmail-specific: get labels early to filter spam/trash
+        labels = str(message.get("X-Gmail-Labels", "") or "")
+
+        # Skip spam, trash, and drafts
+        if _is_spam_trash(labels):
+            stats["spam_trash"] += 1
+            return None
+
+        # Extract headers (convert Header objects to strings)
+        msg_id = str(message.get("Message-ID", "") or "")
+        from_addr = str(message.get("From", "") or "")
+        to_addr = str(message.get("To", "") or "")
+        cc_addr = str(message.get("Cc", "") or "")
+        subject = str(message.get("Subject", "") or "")
+        date = str(message.get("Date", "") or "")
+
+        # Filter by age early
+        if _is_too_old(date, cutoff_date):
+            stats["too_old"] += 1
+            return None
+
+        if _is_other_sender(from_addr, sender_email):
+            stats["skipped_sender"] += 1
+            return None
+
+        # Extract body (skipping attachments)
+        plain_body, html_body = extract_body_from_message(message)
+
+        # Prefer plain text, fall back to HTML
+        body = plain_body if plain_body.strip() else html_body
+
+        if not body.strip() and not subject.strip():
+            stats["skipped"] += 1
+            return None
+
+        return {
+            "Message-ID": msg_id,
+            "From": from_addr,
+            "To": to_addr,
+            "Cc": cc_addr,
+            "Subject": subject,
+            "Date": date,
+            "Body": body,
+            "X-Gmail-Labels": labels,
+        }
+
+    except Exception as e:
+        if not quiet:
+            print(f"      Warning: Failed to parse message {stats['total']}: {e}")
+        stats["skipped"] += 1
+        return None
+
+
 def import_mbox_single(
     input_path: str,
     quiet: bool = False,
@@ -168,107 +574,522 @@ def import_mbox_single(
     """
     Import a single MBOX file to a list of email dicts.
 
+    Prefer iter_mbox_single() for large mailboxes - this collects everything
+    in memory.
+
     Returns:
         Tuple of (emails_list, stats_dict)
     """
-    from email.utils import parsedate_to_datetime
+    stats: Dict[str, int] = {}
+    emails = list(iter_mbox_single(input_path, stats, quiet=quiet, max_age_years=max_age_years))
+    return emails, stats
 
-    mbox = mailbox.mbox(input_path)
-    emails = []
-    total = 0
-    skipped = 0
-    spam_trash = 0
-    too_old = 0
 
-    # Calculate cutoff date
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_years * 365)
+class RecordWriter:
+    """
+    Incrementally write records to a JSON array or JSONL file.
+
+    Each record is serialized as soon as it is written, so memory stays flat
+    regardless of how many records pass through. Paths ending in .jsonl get
+    one record per line; anything else becomes a JSON array with one record
+    per line, which json.load and ijson both read as before. A further .gz
+    suffix (e.g. cleaned_emails.jsonl.gz) gzip-compresses the output.
 
-    for message in mbox:
-        total += 1
+    Passing resume=(offset, count) from an earlier checkpoint() discards
+    whatever was written after that point and continues from there. Each
+    checkpoint ends a gzip member, so a resumed file is still valid gzip.
+    """
 
-        if not quiet and total % 100 == 0:
-            print(f"      Processed {total} messages...", flush=True)
+    def __init__(self, path: str, resume: Optional[Tuple[int, int]] = None):
+        self.path = path
+        self.gzip = path.lower().endswith(".gz")
+        self.jsonl = path.lower().removesuffix(".gz").endswith(".jsonl")
+        self.count = 0
+        if resume:
+            offset, self.count = resume
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+            self._raw = open(path, "ab")
+        else:
+            self._raw = open(path, "wb")
+        self._out = self._open_member()
+        if not resume and not self.jsonl:
+            self._out.write(b"[")
+
+    def _open_member(self):
+        if self.gzip:
+            return gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        return self._raw
+
+    def write(self, record: Dict[str, Any]) -> None:
+        if not isinstance(record, dict):
+            record = dict(record)
+        line = json.dumps(record, ensure_ascii=False)
+        if self.jsonl:
+            self._out.write(f"{line}\n".encode("utf-8"))
+        else:
+            self._out.write(f"{',' if self.count else ''}\n{line}".encode("utf-8"))
+        self.count += 1
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """Flush to disk and return (byte offset, record count) to resume from."""
+        if self.gzip:
+            self._out.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        offset = self._raw.tell()
+        if self.gzip:
+            self._out = self._open_member()
+        return offset, self.count
+
+    def close(self) -> None:
+        if self._raw.closed:
+            return
+        if not self.jsonl:
+            self._out.write(b"\n]\n" if self.count else b"]\n")
+        if self.gzip:
+            self._out.close()
+        self._raw.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Column store: an offset-indexed binary file (.cols) holding each field as
+# its own column, so a stage can read From/Date/Subject for every record and
+# touch Body bytes only for the records that get that far.
+#
+# Layout: magic, then per column a kind byte per row (0 = missing, 1 = str,
+# 2 = JSON), the row end offsets (uint64, row r spans offsets[r]..[r+1]) and
+# the concatenated values; then a JSON footer locating each column, the
+# footer length (uint64) and the magic again.
+COLUMN_STORE_SUFFIX = ".cols"
+COLUMN_STORE_MAGIC = b"VSCOLS01"
+
+_KIND_MISSING, _KIND_STR, _KIND_JSON = 0, 1, 2
+
+
+def is_column_store(path: str) -> bool:
+    """True if the path names a column store (by its .cols suffix)."""
+    return path.lower().endswith(COLUMN_STORE_SUFFIX)
+
+
+class ColumnWriter:
+    """
+    Incrementally write records to a column store; same interface as RecordWriter.
 
-        try:
-            # Gmail-specific: get labels early to filter spam/trash
-            labels = str(message.get("X-Gmail-Labels", "") or "")
-            label_list = [l.strip().lower() for l in labels.split(",")]
+    Values are spooled to one anonymous temp file per column while writing
+    (only a kind byte per row and column stays in memory), and the store is
+    assembled when the writer is closed.
+    """
 
-            # Skip spam, trash, and drafts
-            if "spam" in label_list or "trash" in label_list or "draft" in label_list or "drafts" in label_list:
-                spam_trash += 1
-                continue
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        # name -> [kinds, offsets spool, data spool, data length]
+        self._columns: Dict[str, List[Any]] = {}
+
+    def _add_column(self, name: str) -> List[Any]:
+        column = [bytearray(self.count), tempfile.TemporaryFile(), tempfile.TemporaryFile(), 0]
+        column[1].write(b"\0" * 8 * (self.count + 1))
+        self._columns[name] = column
+        return column
+
+    def write(self, record: Dict[str, Any]) -> None:
+        for name in record:
+            if name not in self._columns:
+                self._add_column(name)
+        for name, column in self._columns.items():
+            if name not in record:
+                column[0].append(_KIND_MISSING)
+            else:
+                value = record[name]
+                if isinstance(value, str):
+                    column[0].append(_KIND_STR)
+                else:
+                    column[0].append(_KIND_JSON)
+                    value = json.dumps(value, ensure_ascii=False)
+                column[3] += column[2].write(value.encode("utf-8", "surrogatepass"))
+            column[1].write(struct.pack("<Q", column[3]))
+        self.count += 1
+
+    def close(self) -> None:
+        if self._columns is None:
+            return
+        footer: Dict[str, Any] = {"count": self.count, "columns": {}}
+        with open(self.path, "wb") as out:
+            out.write(COLUMN_STORE_MAGIC)
+            for name, (kinds, offsets, data, _) in self._columns.items():
+                sections = []
+                for blob in (kinds, offsets, data):
+                    out.write(b"\0" * (-out.tell() % 8))
+                    sections.append(out.tell())
+                    if isinstance(blob, bytearray):
+                        out.write(blob)
+                    else:
+                        blob.seek(0)
+                        for block in iter(lambda: blob.read(1024 * 1024), b""):
+                            out.write(block)
+                        blob.close()
+                footer["columns"][name] = sections
+            encoded = json.dumps(footer).encode("utf-8")
+            out.write(encoded)
+            out.write(struct.pack("<Q", len(encoded)))
+            out.write(COLUMN_STORE_MAGIC)
+        self._columns = None
+
+    def __enter__(self) -> "ColumnWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ColumnStore:
+    """
+    Read-only, memory-mapped view of a column store.
 
-            # Extract headers (convert Header objects to strings)
-            msg_id = str(message.get("Message-ID", "") or "")
-            from_addr = str(message.get("From", "") or "")
-            to_addr = str(message.get("To", "") or "")
-            cc_addr = str(message.get("Cc", "") or "")
-            subject = str(message.get("Subject", "") or "")
-            date = str(message.get("Date", "") or "")
+    Values are decoded from the mapping one cell at a time, so reading the
+    From column of a million records never pages in their bodies. Closing
+    the store first loads every field of the ColumnRecords still alive, so
+    they keep working as plain records.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # row -> its ColumnRecord, while one is alive
+        self._records: "weakref.WeakValueDictionary[int, ColumnRecord]" = weakref.WeakValueDictionary()
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._mm)
+        if self._mm[:8] != COLUMN_STORE_MAGIC or self._mm[size - 8:] != COLUMN_STORE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a complete column store")
+        (footer_len,) = struct.unpack_from("<Q", self._mm, size - 16)
+        footer = json.loads(self._mm[size - 16 - footer_len:size - 16])
+        self.count: int = footer["count"]
+        self._columns: Dict[str, List[int]] = footer["columns"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def has(self, name: str, row: int) -> bool:
+        column = self._columns.get(name)
+        return column is not None and self._mm[column[0] + row] != _KIND_MISSING
+
+    def value(self, name: str, row: int) -> Any:
+        """Decode one cell; raises KeyError if the record has no such field."""
+        column = self._columns.get(name)
+        kind = self._mm[column[0] + row] if column else _KIND_MISSING
+        if kind == _KIND_MISSING:
+            raise KeyError(name)
+        start, end = struct.unpack_from("<QQ", self._mm, column[1] + 8 * row)
+        text = self._mm[column[2] + start:column[2] + end].decode("utf-8", "surrogatepass")
+        return text if kind == _KIND_STR else json.loads(text)
+
+    def iter_column(self, name: str) -> Iterator[Any]:
+        """Yield one column's values in row order (None where missing)."""
+        for row in range(self.count):
+            yield self.value(name, row) if self.has(name, row) else None
+
+    def row_keys(self, row: int) -> List[str]:
+        return [name for name in self._columns if self.has(name, row)]
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        for record in list(self._records.values()):
+            record._detach()
+        self._mm.close()
+        self._f.close()
+
+
+class ColumnRecord(MutableMapping):
+    """
+    One row of a ColumnStore, behaving like the record dict it was written from.
+
+    Fields are decoded on first access and cached; assignments are kept on
+    the record, so curation can tag it like any other dict. Pickling (e.g.
+    to send it to a worker process) turns it into a plain dict.
+    """
+
+    __slots__ = ("_store", "_row", "_values", "__weakref__")
+    _UNSET = object()
+    _DELETED = object()
+
+    def __init__(self, store: ColumnStore, row: int):
+        self._store: Optional[ColumnStore] = store
+        self._row = row
+        self._values: Dict[str, Any] = {}
+        store._records[row] = self
+
+    def _detach(self) -> None:
+        """Load every remaining field and drop the store (before it closes)."""
+        for key in self._store.row_keys(self._row):
+            if key not in self._values:
+                self._values[key] = self._store.value(key, self._row)
+        self._store = None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._values.get(key, self._UNSET)
+        if value is self._UNSET:
+            if self._store is None:
+                raise KeyError(key)
+            value = self._values[key] = self._store.value(key, self._row)
+        if value is self._DELETED:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._values:
+            return self._values[key] is not self._DELETED
+        return isinstance(key, str) and self._store is not None and self._store.has(key, self._row)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values[key] = self._DELETED
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._store.row_keys(self._row) if self._store is not None else []
+        keys += [k for k in self._values if k not in keys]
+        return (k for k in keys if k in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def open_record_writer(path: str, resume: Optional[Tuple[int, int]] = None):
+    """RecordWriter, or ColumnWriter for a .cols path (which can't be resumed)."""
+    if is_column_store(path):
+        if resume:
+            raise ValueError(f"can't append to column store {path}")
+        return ColumnWriter(path)
+    return RecordWriter(path, resume)
+
+
+def _ordered_pool_map(
+    fn,
+    tasks: Iterable[Any],
+    workers: int,
+    initializer=None,
+    initargs: Tuple[Any, ...] = ()
+) -> Iterator[Any]:
+    """
+    Run fn over tasks in a process pool, yielding results in task order.
+
+    At most 2 * workers tasks are in flight at once, so finished results
+    never pile up in memory while an earlier, slower task completes.
+    initializer(*initargs) runs once in each worker, for state shared by
+    every task (sent once per process instead of once per task).
+    """
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, task))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Message-IDs an import worker should skip, set once per worker process
+_worker_skip_message_ids: Optional[Set[str]] = None
 
-            # Filter by age early
-            if date:
-                try:
-                    msg_date = parsedate_to_datetime(date)
-                    if msg_date.tzinfo is None:
-                        msg_date = msg_date.replace(tzinfo=timezone.utc)
-                    if msg_date < cutoff_date:
-                        too_old += 1
-                        continue
-                except Exception:
-                    pass  # If date parsing fails, keep the message
 
-            # Extract body (skipping attachments)
-            plain_body, html_body = extract_body_from_message(message)
+def _init_import_worker(skip_message_ids: Optional[Set[str]]) -> None:
+    global _worker_skip_message_ids
+    _worker_skip_message_ids = skip_message_ids
 
-            # Prefer plain text, fall back to HTML
-            body = plain_body if plain_body.strip() else html_body
 
-            if not body.strip() and not subject.strip():
-                skipped += 1
+def _import_mbox_range(
+    task: Tuple[Any, int, int, int, Optional[str]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Process-pool worker: import one byte range of an MBOX file, or one
+    message-aligned block of bytes streamed out of a ZIP member.
+    """
+    source, start, end, max_age_years, sender_email = task
+    stats: Dict[str, int] = {}
+    if isinstance(source, bytes):
+        for key in ("total", "imported", "skipped", "spam_trash", "too_old", "skipped_sender", "already_seen"):
+            stats[key] = 0
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_years * 365)
+        emails = list(_iter_mbox_buffer(source, start, end, stats, cutoff_date, True, sender_email,
+                                        _worker_skip_message_ids))
+    else:
+        emails = list(iter_mbox_single(source, stats, quiet=True, max_age_years=max_age_years,
+                                       start=start, end=end, sender_email=sender_email,
+                                       skip_message_ids=_worker_skip_message_ids))
+    return emails, stats
+
+
+def _iter_import_chunks(
+    mbox_files: List[str],
+    workers: int = 1,
+    quiet: bool = False,
+    max_age_years: int = 5,
+    sender_email: Optional[str] = None,
+    skip_message_ids: Optional[Set[str]] = None
+) -> Iterator[Tuple[int, Iterable[Dict[str, Any]], Dict[str, int], bool]]:
+    """
+    Yield (file_index, emails, stats, file_done) for each unit of import work.
+
+    With one worker each file is a single streamed unit. With more, every
+    file is split into byte ranges that a process pool imports in parallel;
+    results still come back in file and byte order, so output and stats are
+    identical to a serial run. Consume `emails` before reading `stats`.
+    """
+    if workers <= 1:
+        for i, path in enumerate(mbox_files):
+            stats: Dict[str, int] = {}
+            emails = iter_mbox_single(path, stats, quiet=quiet, max_age_years=max_age_years,
+                                      sender_email=sender_email, skip_message_ids=skip_message_ids)
+            yield i, emails, stats, True
+        return
+
+    # Plain files are split into byte ranges up front; ZIP members are
+    # decompressed here and shipped to workers as message-aligned blocks
+    owners = []
+
+    def tasks():
+        for i, path in enumerate(mbox_files):
+            if split_zip_member(path):
+                with open_mbox_source(path) as f:
+                    blocks = _iter_mbox_blocks(f)
+                    block = next(blocks, b"")
+                    for following in blocks:
+                        owners.append((i, False))
+                        yield (block, 0, len(block), max_age_years, sender_email)
+                        block = following
+                    owners.append((i, True))
+                    yield (block, 0, len(block), max_age_years, sender_email)
                 continue
+            ranges = split_mbox_ranges(path)
+            for j, (start, end) in enumerate(ranges):
+                owners.append((i, j == len(ranges) - 1))
+                yield (path, start, end, max_age_years, sender_email)
+
+    if not quiet:
+        print(f"\n   ⚡ Importing with {workers} workers")
 
-            emails.append({
-                "Message-ID": msg_id,
-                "From": from_addr,
-                "To": to_addr,
-                "Cc": cc_addr,
-                "Subject": subject,
-                "Date": date,
-                "Body": body,
-                "X-Gmail-Labels": labels,
-            })
+    results = _ordered_pool_map(_import_mbox_range, tasks(), workers,
+                                initializer=_init_import_worker, initargs=(skip_message_ids,))
+    for n, (emails, stats) in enumerate(results):
+        i, file_done = owners[n]
+        yield i, emails, stats, file_done
 
-        except Exception as e:
-            if not quiet:
-                print(f"      Warning: Failed to parse message {total}: {e}")
-            skipped += 1
+
+def iter_import(
+    mbox_files: List[str],
+    total_stats: Dict[str, int],
+    workers: int = 1,
+    quiet: bool = False,
+    sender_email: Optional[str] = None,
+    skip_message_ids: Optional[Set[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream email dicts from a list of MBOX files in file order.
+
+    Per-file counters are summed into `total_stats` (total, imported,
+    skipped, spam_trash, skipped_sender, already_seen) as each file finishes.
+    """
+    for key in ("total", "imported", "skipped", "spam_trash", "skipped_sender", "already_seen"):
+        total_stats.setdefault(key, 0)
+
+    file_stats: Dict[str, int] = {}
+    for i, emails, stats, file_done in _iter_import_chunks(mbox_files, workers, quiet,
+                                                           sender_email=sender_email,
+                                                           skip_message_ids=skip_message_ids):
+        if not file_stats and not quiet:
+            rel_name = os.path.basename(mbox_files[i])
+            if len(mbox_files) > 1:
+                print(f"\n   📄 [{i + 1}/{len(mbox_files)}] {rel_name}")
+            else:
+                print(f"\n   📄 {rel_name}")
+
+        yield from emails
+
+        for key in ("total", "imported", "skipped", "spam_trash", "skipped_sender", "already_seen"):
+            file_stats[key] = file_stats.get(key, 0) + stats[key]
+        if not file_done:
             continue
 
-    mbox.close()
+        for key in ("total", "imported", "skipped", "spam_trash", "skipped_sender", "already_seen"):
+            total_stats[key] += file_stats[key]
+
+        if not quiet:
+            msg = f"      ✓ {file_stats['imported']} emails imported"
+            if file_stats["spam_trash"] > 0:
+                msg += f" (🗑️ {file_stats['spam_trash']} spam/trash/drafts filtered)"
+            if file_stats["already_seen"] > 0:
+                msg += f" (⏭️ {file_stats['already_seen']} seen in earlier runs)"
+            print(msg)
+        file_stats = {}
+
 
-    return emails, {"total": total, "imported": len(emails), "skipped": skipped, "spam_trash": spam_trash, "too_old": too_old}
+def _print_takeout_instructions() -> None:
+    print(f"\n❌ No MBOX files found!")
+    print(f"\n📋 INSTRUCTIONS:")
+    print(f"   1. Go to https://takeout.google.com")
+    print(f"   2. Select only 'Mail' and click 'Next'")
+    print(f"   3. Choose file size: 50 GB (to avoid splitting)")
+    print(f"   4. Download and either:")
+    print(f"      • Point to the .zip file directly")
+    print(f"      • Extract it and point to the folder")
+    print(f"      • Point to a specific .mbox file")
+    print(f"\n   Examples:")
+    print(f"      python pipeline.py run takeout.zip --sender you@gmail.com")
+    print(f"      python pipeline.py run ./Takeout/ --sender you@gmail.com")
+    print(f"      python pipeline.py run 'All mail.mbox' --sender you@gmail.com")
 
 
 def import_mbox(
     input_path: str,
     output_path: Optional[str] = None,
-    quiet: bool = False
+    quiet: bool = False,
+    workers: int = 1,
+    sender_email: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Import MBOX file(s) from a path (file, directory, or zip) to JSON.
     Strips attachments, keeps only text content.
 
+    Messages are streamed to the output as they are parsed, so peak memory
+    does not grow with mailbox size. An output path ending in .jsonl is
+    written as JSONL, one ending in .cols as a column store, otherwise as a
+    JSON array.
+
     Supports:
     - Single .mbox file
     - Directory containing .mbox files (searches recursively)
-    - .zip file (Google Takeout export - extracts and finds .mbox files)
+    - .zip file (Google Takeout export - reads .mbox members in place,
+      including every part of a split takeout-*-001.zip export)
 
     Args:
         input_path: Path to MBOX file, directory, or zip file
-        output_path: Path to output JSON file (default: emails_raw.json)
+        output_path: Path to output JSON/JSONL file (default: emails_raw.json)
         quiet: If True, suppress progress output
+        workers: Number of processes; >1 imports files and byte ranges of
+            large files in parallel (output order is unchanged)
+        sender_email: Only import emails from this sender (None = keep all).
+            Matched like clean_emails, so later stages only see candidates.
 
     Returns:
         Statistics dict
@@ -290,46 +1111,21 @@ def import_mbox(
 
     if not mbox_files:
         if not quiet:
-            print(f"\n❌ No MBOX files found!")
-            print(f"\n📋 INSTRUCTIONS:")
-            print(f"   1. Go to https://takeout.google.com")
-            print(f"   2. Select only 'Mail' and click 'Next'")
-            print(f"   3. Choose file size: 50 GB (to avoid splitting)")
-            print(f"   4. Download and either:")
-            print(f"      • Point to the .zip file directly")
-            print(f"      • Extract it and point to the folder")
-            print(f"      • Point to a specific .mbox file")
-            print(f"\n   Examples:")
-            print(f"      python pipeline.py run takeout.zip --sender you@gmail.com")
-            print(f"      python pipeline.py run ./Takeout/ --sender you@gmail.com")
-            print(f"      python pipeline.py run 'All mail.mbox' --sender you@gmail.com")
-        return {"total": 0, "imported": 0, "skipped": 0, "files": 0, "output": output_path}
-
-    # Import all MBOX files
-    all_emails = []
-    total_stats = {"total": 0, "imported": 0, "skipped": 0, "spam_trash": 0, "files": len(mbox_files)}
-
-    for i, mbox_path in enumerate(mbox_files, 1):
-        if not quiet:
-            rel_name = os.path.basename(mbox_path)
-            if len(mbox_files) > 1:
-                print(f"\n   📄 [{i}/{len(mbox_files)}] {rel_name}")
-            else:
-                print(f"\n   📄 {rel_name}")
+            _print_takeout_instructions()
+        return {"total": 0, "imported": 0, "skipped": 0, "skipped_sender": 0, "files": 0, "output": output_path}
 
-        emails, stats = import_mbox_single(mbox_path, quiet=quiet)
-        all_emails.extend(emails)
+    # Import all MBOX files, streaming each message straight to disk
+    total_stats = {"total": 0, "imported": 0, "skipped": 0, "spam_trash": 0, "skipped_sender": 0,
+                   "files": len(mbox_files)}
 
-        total_stats["total"] += stats["total"]
-        total_stats["imported"] += stats["imported"]
-        total_stats["skipped"] += stats["skipped"]
-        total_stats["spam_trash"] += stats["spam_trash"]
+    if sender_email and not quiet:
+        print(f"📧 Importing only emails from: {sender_email}")
 
-        if not quiet:
-            msg = f"      ✓ {stats['imported']} emails imported"
-            if stats["spam_trash"] > 0:
-                msg += f" (🗑️ {stats['spam_trash']} spam/trash/drafts filtered)"
-            print(msg)
+    with open_record_writer(output_path) as writer:
+        for email in iter_import(mbox_files, total_stats, workers, quiet, sender_email):
+            writer.write(email)
+    write_stage_manifest("import", input_path, output_path, import_params(sender_email),
+                         total_stats["imported"])
 
     if not quiet:
         print(f"\n{'─'*60}")
@@ -339,10 +1135,9 @@ def import_mbox(
             print(f"📊 TOTAL: {total_stats['imported']} emails")
         if total_stats["spam_trash"] > 0:
             print(f"🗑️ Filtered: {total_stats['spam_trash']} spam/trash/drafts")
-        print(f"💾 Saving to: {output_path}")
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(all_emails, f, ensure_ascii=False, indent=2)
+        if total_stats["skipped_sender"] > 0:
+            print(f"📧 Filtered: {total_stats['skipped_sender']} from other senders")
+        print(f"💾 Saved to: {output_path}")
 
     total_stats["output"] = output_path
     return total_stats
@@ -371,8 +1166,8 @@ def detect_owner_email(input_path: str, sample_size: int = 50) -> Optional[str]:
     # Just read first few KB to find Delivered-To header - nearly instant
     for mbox_path in mbox_files:
         try:
-            with open(mbox_path, "r", encoding="utf-8", errors="ignore") as f:
-                chunk = f.read(8192)  # First 8KB has the headers
+            with open_mbox_source(mbox_path) as f:
+                chunk = f.read(8192).decode("utf-8", errors="ignore")  # First 8KB has the headers
                 match = re.search(r"^Delivered-To:\s*(.+)$", chunk, re.MULTILINE | re.IGNORECASE)
                 if match:
                     _, email = parseaddr(match.group(1).strip())
@@ -433,6 +1228,27 @@ def filter_record(record: Dict[str, Any]) -> Dict[str, Any]:
     return filtered
 
 
+def iter_converted(
+    records: Iterable[Dict[str, Any]],
+    stats: Dict[str, int],
+    strip_fields: bool = True,
+    quiet: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Apply the field whitelist to a stream of records, counting total/kept in `stats`."""
+    stats.setdefault("total", 0)
+    stats.setdefault("kept", 0)
+    for record in records:
+        stats["total"] += 1
+        if strip_fields:
+            record = filter_record(record)
+        if not quiet and stats["total"] % 2000 == 0:
+            print(f"      ⏳ {stats['total']:,} records processed...")
+        if not record:
+            continue
+        stats["kept"] += 1
+        yield record
+
+
 def convert_to_jsonl(
     input_path: str,
     output_path: Optional[str] = None,
@@ -443,50 +1259,39 @@ def convert_to_jsonl(
     Convert JSON array to JSONL format, optionally stripping attachments.
 
     Args:
-        input_path: Path to input JSON file
-        output_path: Path to output JSONL file (default: input with .jsonl extension)
+        input_path: Path to input JSON file (a JSONL file or column store is
+            also accepted)
+        output_path: Path to output JSONL file (default: input with .jsonl
+            extension); a .cols path writes a column store instead
         strip_fields: If True, apply field whitelist filtering
         quiet: If True, suppress progress output
 
     Returns:
         Statistics dict with counts
     """
-    try:
-        import ijson
-    except ImportError:
-        print("Error: ijson not installed. Run: pip install ijson")
-        sys.exit(1)
-
     if output_path is None:
         if input_path.endswith(".json"):
             output_path = input_path[:-5] + ".jsonl"
+        elif is_column_store(input_path):
+            output_path = input_path[:-len(COLUMN_STORE_SUFFIX)] + ".jsonl"
         else:
             output_path = input_path + ".jsonl"
 
-    total = kept = 0
+    stats: Dict[str, int] = {}
 
     if not quiet:
         print(f"   📂 Reading: {os.path.basename(input_path)}")
 
-    with open(input_path, "r", encoding="utf-8") as fin, \
-         open(output_path, "w", encoding="utf-8") as fout:
-        for record in ijson.items(fin, "item"):
-            total += 1
-            if strip_fields:
-                record = filter_record(record)
-            if not record:
-                continue
-            json.dump(record, fout, ensure_ascii=False)
-            fout.write("\n")
-            kept += 1
-            if not quiet and total % 2000 == 0:
-                print(f"      ⏳ {total:,} records processed...")
+    with open_record_writer(output_path) as writer:
+        for record in iter_converted(iter_records(input_path), stats, strip_fields, quiet):
+            writer.write(record)
+    write_stage_manifest("convert", input_path, output_path, convert_params(strip_fields), stats["kept"])
 
     if not quiet:
-        print(f"   ✓ Converted {kept:,} records")
+        print(f"   ✓ Converted {stats['kept']:,} records")
         print(f"   💾 Saved to: {os.path.basename(output_path)}")
 
-    return {"total": total, "kept": kept, "output": output_path}
+    return {"total": stats["total"], "kept": stats["kept"], "output": output_path}
 
 
 # =============================================================================
@@ -496,19 +1301,99 @@ def convert_to_jsonl(
 _analyzer = None
 _anonymizer = None
 
+# NER model tiers for PII detection, from most accurate to fastest.
+# "rules" loads no spaCy model at all: only pattern recognizers run, so
+# names and places are not detected, and weak patterns that need a context
+# word (passport numbers, most SSN formats) are missed too.
+PII_MODELS = {
+    "lg": "en_core_web_lg",
+    "md": "en_core_web_md",
+    "sm": "en_core_web_sm",
+    "rules": None,
+}
+
+
+def _default_pii_model() -> str:
+    """The tier named by VOICE_SYNTH_PII_MODEL, or "lg" if unset or unknown."""
+    name = os.environ.get("VOICE_SYNTH_PII_MODEL", "lg")
+    if name not in PII_MODELS:
+        print(f"Warning: unknown VOICE_SYNTH_PII_MODEL {name!r} (choose from {', '.join(PII_MODELS)}), "
+              f"using lg", file=sys.stderr)
+        return "lg"
+    return name
+
+
+DEFAULT_PII_MODEL = _default_pii_model()
+
+# Pipeline components Presidio never reads. tagger, attribute_ruler and
+# lemmatizer stay: Presidio's context enhancer matches words like "passport"
+# or "ssn" against token lemmas, and without them weak patterns (US_PASSPORT,
+# most US_SSN formats) never reach the score threshold.
+SPACY_EXCLUDED_COMPONENTS = ["parser", "senter"]
+
+_pii_model = DEFAULT_PII_MODEL
+
+
+def pii_model_available(name: str) -> bool:
+    """True if the spaCy package behind a model tier is installed."""
+    if name not in PII_MODELS:
+        return False
+    if PII_MODELS[name] is None:
+        return True
+    try:
+        import spacy
+    except ImportError:
+        return False
+    return spacy.util.is_package(PII_MODELS[name])
+
+
+def pii_model_fingerprint() -> str:
+    """Identify the configured tier and the spaCy components it loads."""
+    if PII_MODELS[_pii_model] is None:
+        return _pii_model
+    return f"{_pii_model} -{' -'.join(SPACY_EXCLUDED_COMPONENTS)}"
+
+
+def configure_pii_model(name: str) -> None:
+    """Select the NER model tier (see PII_MODELS) used by get_analyzer."""
+    global _pii_model, _analyzer, _pattern_recognizers
+    if name not in PII_MODELS:
+        raise ValueError(f"Unknown PII model {name!r} (choose from {', '.join(PII_MODELS)})")
+    if name == _pii_model:
+        return
+    _pii_model = name
+    _analyzer = None
+    _pattern_recognizers = None
+
 
 def get_analyzer():
-    """Lazy initialization of Presidio analyzer."""
+    """Lazy initialization of Presidio analyzer for the configured model tier."""
     global _analyzer
     if _analyzer is None:
         try:
+            import spacy
             from presidio_analyzer import AnalyzerEngine
-            _analyzer = AnalyzerEngine()
+            from presidio_analyzer.nlp_engine import SpacyNlpEngine
         except ImportError:
             print("Error: presidio-analyzer not installed.")
             print("Run: pip install presidio-analyzer presidio-anonymizer")
             print("Then: python -m spacy download en_core_web_lg")
             sys.exit(1)
+
+        model_name = PII_MODELS[_pii_model]
+        if model_name is None:
+            nlp = spacy.blank("en")
+        else:
+            try:
+                nlp = spacy.load(model_name, exclude=SPACY_EXCLUDED_COMPONENTS)
+            except OSError:
+                print(f"Error: spaCy model {model_name} not installed.")
+                print(f"Run: python -m spacy download {model_name}")
+                sys.exit(1)
+
+        nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": model_name or "blank"}])
+        nlp_engine.nlp = {"en": nlp}
+        _analyzer = AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=["en"])
     return _analyzer
 
 
@@ -545,52 +1430,419 @@ def get_operators():
     }
 
 
-def anonymize_pii(text: str, score_threshold: float = 0.4) -> str:
-    """Detect and anonymize PII in text using Presidio."""
-    if not text or not text.strip():
-        return text
-    analyzer = get_analyzer()
-    anonymizer = get_anonymizer()
-    results = analyzer.analyze(
-        text=text, entities=PII_ENTITIES, language="en", score_threshold=score_threshold
-    )
-    if not results:
-        return text
-    anonymized = anonymizer.anonymize(text=text, analyzer_results=results, operators=get_operators())
-    return anonymized.text
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "voice-synth"
+PII_CACHE_PATH = str(CACHE_DIR / "pii_cache.sqlite3")
+PII_CACHE_MAX_ENTRIES = 500_000
 
 
-# Regex patterns for email-specific cleaning
-QUOTED_REPLY_RE = re.compile(r'^(On .+ wrote:|From:|Sent:|To:|Subject:|-----Original Message-----)', re.IGNORECASE)
-QUOTE_MARK_RE = re.compile(r'^\s*>', re.MULTILINE)
-SIG_SEP_RE = re.compile(r'^(--\s*$|—\s*$|___+\s*$)', re.MULTILINE | re.IGNORECASE)
-SIG_FOOT_RE = re.compile(
-    r'^(Sent from my iPhone.*$|Sent from my iPad.*$|Get Outlook for.*$|'
-    r'Please consider the environment.*$|This message.*confidential.*$)',
-    re.MULTILINE | re.IGNORECASE
-)
-UNSUB_RE = re.compile(r'unsubscribe|manage your preferences|update preferences', re.IGNORECASE)
-HTML_TAG_RE = re.compile(r'<[^>]+>')
+class PIICache:
+    """
+    On-disk cache of anonymized text, shared across runs.
 
-AUTO_SUBJECT_KEYWORDS = [
-    "out of office", "ooo", "automatic reply", "auto-reply", "autoreply",
-    "away from the office", "on vacation", "out of the office",
-    "has accepted this invitation", "has declined this invitation",
-]
+    Entries are keyed by a SHA-256 of the text together with the detection
+    settings (score threshold, entity list, detection tier and NER model),
+    so a change to any of them never serves stale results. Least recently
+    used entries are evicted once the cache grows past max_entries.
+    """
 
+    def __init__(self, path: str = PII_CACHE_PATH, max_entries: int = PII_CACHE_MAX_ENTRIES):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.pid = os.getpid()
+        self._writes = 0
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pii (key BLOB PRIMARY KEY, value BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS pii_last_used ON pii (last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def key(text: str, score_threshold: float, tier: str = "ner") -> bytes:
+        # Pattern-only results don't depend on the NER model
+        model = pii_model_fingerprint() if tier == PII_TIER_NER else "-"
+        h = hashlib.sha256(f"{score_threshold!r}|{','.join(PII_ENTITIES)}|{model}|{tier}|".encode())
+        h.update(text.encode("utf-8", "surrogatepass"))
+        return h.digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, str]:
+        """Look up many keys at once; hits are marked as recently used."""
+        import time
+
+        found: Dict[bytes, str] = {}
+        for i in range(0, len(keys), 500):
+            part = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, value FROM pii WHERE key IN ({','.join('?' * len(part))})", part
+            )
+            for key, value in rows:
+                found[key] = value.decode("utf-8", "surrogatepass")
+        if found:
+            now = time.time()
+            self.conn.executemany("UPDATE pii SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+            self.conn.commit()
+        return found
+
+    def put_many(self, items: Dict[bytes, str]) -> None:
+        import time
+
+        if not items:
+            return
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO pii (key, value, last_used) VALUES (?, ?, ?)",
+            [(k, v.encode("utf-8", "surrogatepass"), now) for k, v in items.items()]
+        )
+        self.conn.commit()
+        self._writes += len(items)
+        # Amortize eviction: only check the size every ~10% of capacity
+        if self._writes >= max(1000, self.max_entries // 10):
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop least recently used entries beyond max_entries."""
+        self._writes = 0
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM pii").fetchone()
+        if count > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM pii WHERE key IN (SELECT key FROM pii ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        self.evict()
+        self.conn.close()
+
+
+_pii_cache: Optional[PIICache] = None
+_pii_cache_settings: Optional[Tuple[str, int]] = (PII_CACHE_PATH, PII_CACHE_MAX_ENTRIES)
+
+
+def configure_pii_cache(path: Optional[str] = PII_CACHE_PATH, max_entries: int = PII_CACHE_MAX_ENTRIES) -> None:
+    """Point the PII cache at another file or size limit, or disable it with path=None."""
+    global _pii_cache, _pii_cache_settings
+    settings = (path, max_entries) if path else None
+    if settings == _pii_cache_settings:
+        return
+    close_pii_cache()
+    _pii_cache_settings = settings
+
+
+def close_pii_cache() -> None:
+    global _pii_cache
+    if _pii_cache is not None and _pii_cache.pid == os.getpid():
+        _pii_cache.close()
+    _pii_cache = None
+
+
+def get_pii_cache() -> Optional[PIICache]:
+    """Lazy per-process PII cache (None when disabled or unavailable)."""
+    global _pii_cache, _pii_cache_settings
+    if _pii_cache_settings is None:
+        return None
+    # A connection inherited from a parent process can't be shared
+    if _pii_cache is None or _pii_cache.pid != os.getpid():
+        try:
+            _pii_cache = PIICache(*_pii_cache_settings)
+        except Exception as e:
+            print(f"   ⚠️  PII cache unavailable ({e}); continuing without it")
+            _pii_cache_settings = None
+            _pii_cache = None
+    return _pii_cache
 
-def strip_html(text: str) -> str:
-    return HTML_TAG_RE.sub("", text)
 
+# PII detection tiers:
+#   "ner"      - the full AnalyzerEngine, spaCy NER plus every pattern
+#                recognizer; needed for free text that can name people/places
+#   "patterns" - pattern recognizers only (emails, phones, URLs, IPs, cards,
+#                ...), with no spaCy pass; used for bare email addresses
+PII_TIER_NER = "ner"
+PII_TIER_PATTERNS = "patterns"
 
-def remove_quoted_replies(t: str) -> str:
-    lines = t.splitlines()
-    out = []
-    for line in lines:
-        if QUOTED_REPLY_RE.match(line):
-            break
-        if QUOTE_MARK_RE.match(line):
-            continue
+# Texts per spaCy nlp.pipe() batch in the clean stage
+PII_BATCH_SIZE = 64
+
+# Longer texts are split on paragraph boundaries before the NER pass, which
+# keeps spaCy's time and memory per document bounded (and far below
+# nlp.max_length)
+PII_CHUNK_CHARS = 10_000
+
+ADDRESS_ONLY_RE = re.compile(r"^[^\s@<>]+@[^\s@<>]+$")
+
+_pattern_recognizers = None
+
+
+def pii_tier_for_address(addr: str) -> str:
+    """Addresses that are just user@domain can't hold names outside the match."""
+    return PII_TIER_PATTERNS if ADDRESS_ONLY_RE.match(addr.strip()) else PII_TIER_NER
+
+
+def get_pattern_recognizers():
+    """The analyzer's recognizers that don't depend on the spaCy NER pass."""
+    global _pattern_recognizers
+    if _pattern_recognizers is None:
+        from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+        recognizers = get_analyzer().registry.get_recognizers(language="en", entities=PII_ENTITIES)
+        _pattern_recognizers = [r for r in recognizers if not isinstance(r, SpacyRecognizer)]
+        for recognizer in _pattern_recognizers:
+            if not recognizer.is_loaded:
+                recognizer.load()
+                recognizer.is_loaded = True
+    return _pattern_recognizers
+
+
+def analyze_patterns(text: str, score_threshold: float = 0.4):
+    """Run only the pattern recognizers over text (no NLP artifacts, no context boost)."""
+    from presidio_analyzer import EntityRecognizer
+
+    results = []
+    for recognizer in get_pattern_recognizers():
+        results.extend(recognizer.analyze(text=text, entities=PII_ENTITIES, nlp_artifacts=None) or [])
+    results = [r for r in results if r.score >= score_threshold]
+    return EntityRecognizer.remove_duplicates(results)
+
+
+def effective_pii_tier(tier: str) -> str:
+    """With the "rules" model there is no NER pass, so every text is pattern-only."""
+    return PII_TIER_PATTERNS if _pii_model == "rules" else tier
+
+
+def split_for_analysis(text: str, max_chars: int = PII_CHUNK_CHARS) -> List[Tuple[int, str]]:
+    """
+    Split text into (offset, piece) chunks of at most max_chars.
+
+    Cuts prefer paragraph breaks, then line breaks, then spaces, so entities
+    are rarely split across chunks; a hard cut is the last resort.
+    """
+    pieces = []
+    start = 0
+    while len(text) - start > max_chars:
+        window_end = start + max_chars
+        cut = -1
+        for sep in ("\n\n", "\n", " "):
+            cut = text.rfind(sep, start + 1, window_end)
+            if cut > start:
+                cut += len(sep)
+                break
+        if cut <= start:
+            cut = window_end
+        pieces.append((start, text[start:cut]))
+        start = cut
+    pieces.append((start, text[start:]))
+    return pieces
+
+
+def analyze_pii_batch(
+    texts: List[str],
+    score_threshold: float = 0.4,
+    batch_size: int = PII_BATCH_SIZE,
+    tier: str = PII_TIER_NER
+) -> List[List[Any]]:
+    """
+    Presidio RecognizerResults for each text, using the configured model tier.
+
+    For the NER pass, long texts are split into chunks (see
+    split_for_analysis) and all chunks are fed to spaCy ordered by length,
+    so each nlp.pipe() batch holds similarly sized documents. Chunk results
+    are shifted back to offsets in the original text.
+    """
+    from presidio_analyzer import BatchAnalyzerEngine
+
+    if effective_pii_tier(tier) == PII_TIER_PATTERNS:
+        return [analyze_patterns(t, score_threshold) for t in texts]
+
+    pieces = []
+    for owner, text in enumerate(texts):
+        for offset, piece in split_for_analysis(text):
+            pieces.append((owner, offset, piece))
+    pieces.sort(key=lambda p: len(p[2]))
+
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=get_analyzer())
+    piece_results = batch_analyzer.analyze_iterator(
+        [piece for _, _, piece in pieces], language="en", batch_size=batch_size,
+        entities=PII_ENTITIES, score_threshold=score_threshold
+    )
+
+    results: List[List[Any]] = [[] for _ in texts]
+    for (owner, offset, _), found in zip(pieces, piece_results):
+        for r in found:
+            r.start += offset
+            r.end += offset
+        results[owner].extend(found)
+    for found in results:
+        found.sort(key=lambda r: (r.start, r.end))
+    return results
+
+
+def anonymize_pii(text: str, score_threshold: float = 0.4, tier: str = PII_TIER_NER) -> str:
+    """Detect and anonymize PII in text using Presidio (through the PII cache)."""
+    if not text or not text.strip():
+        return text
+    return anonymize_pii_batch([text], score_threshold, tier=tier)[0]
+
+
+def anonymize_pii_batch(
+    texts: List[str],
+    score_threshold: float = 0.4,
+    batch_size: int = PII_BATCH_SIZE,
+    stats: Optional[Dict[str, int]] = None,
+    tier: str = PII_TIER_NER
+) -> List[str]:
+    """
+    Anonymize many texts at once; same output as anonymize_pii on each.
+
+    Texts go through Presidio's BatchAnalyzerEngine, which runs spaCy over
+    them with nlp.pipe() instead of one forward pass per string (or, for
+    tier="patterns", through the pattern recognizers alone). Repeated
+    texts (common for recipients and boilerplate subjects) are analyzed once,
+    and texts already in the PII cache are not analyzed at all.
+
+    If `stats` is given, its pii_cache_hits / pii_cache_misses counters are
+    updated.
+    """
+    unique = [t for t in dict.fromkeys(texts) if t and t.strip()]
+    if not unique:
+        return list(texts)
+
+    anonymized: Dict[str, str] = {}
+    tier = effective_pii_tier(tier)
+    cache = get_pii_cache()
+    keys: Dict[str, bytes] = {}
+    if cache is not None:
+        keys = {t: cache.key(t, score_threshold, tier) for t in unique}
+        hits = cache.get_many(list(keys.values()))
+        for text, key in keys.items():
+            if key in hits:
+                anonymized[text] = hits[key]
+        if stats is not None:
+            stats["pii_cache_hits"] = stats.get("pii_cache_hits", 0) + len(anonymized)
+            stats["pii_cache_misses"] = stats.get("pii_cache_misses", 0) + len(unique) - len(anonymized)
+        unique = [t for t in unique if t not in anonymized]
+
+    if unique:
+        anonymizer = get_anonymizer()
+        operators = get_operators()
+        all_results = analyze_pii_batch(unique, score_threshold, batch_size, tier)
+
+        fresh = {}
+        for text, results in zip(unique, all_results):
+            if results:
+                text_out = anonymizer.anonymize(text=text, analyzer_results=results, operators=operators).text
+            else:
+                text_out = text
+            anonymized[text] = text_out
+            if cache is not None:
+                fresh[keys[text]] = text_out
+        if cache is not None:
+            cache.put_many(fresh)
+
+    return [anonymized.get(t, t) for t in texts]
+
+
+# Regex patterns for email-specific cleaning
+QUOTED_REPLY_RE = re.compile(r'^(On .+ wrote:|From:|Sent:|To:|Subject:|-----Original Message-----)', re.IGNORECASE)
+QUOTE_MARK_RE = re.compile(r'^\s*>', re.MULTILINE)
+SIG_SEP_RE = re.compile(r'^(--\s*$|—\s*$|___+\s*$)', re.MULTILINE | re.IGNORECASE)
+SIG_FOOT_RE = re.compile(
+    r'^(Sent from my iPhone.*$|Sent from my iPad.*$|Get Outlook for.*$|'
+    r'Please consider the environment.*$|This message.*confidential.*$)',
+    re.MULTILINE | re.IGNORECASE
+)
+UNSUB_RE = re.compile(r'unsubscribe|manage your preferences|update preferences', re.IGNORECASE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def keyword_pattern(keywords: Iterable[str]) -> str:
+    """
+    One regex matching any of `keywords`, shaped like a trie.
+
+    Keywords sharing a prefix share a branch ("s(?:cope|tatus|trategy)"),
+    so at each position the regex engine follows at most one path per
+    character instead of trying every keyword in turn. Optional suffixes
+    are greedy, so the longest keyword at a position wins.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(node[ch]) for ch in sorted(node) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return ("(?:" + body + ")?") if len(branches) == 1 else body + "?"
+        return body
+
+    return build(trie) if trie else "(?!)"
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matching of many keywords in one pass.
+
+    `groups` maps a group name (a topic, say) to its keywords. They are
+    compiled once into a single keyword_pattern regex (or `pattern`, one
+    compiled earlier from the same groups), so each text is scanned once
+    rather than once per keyword as with `w in text`. Matches are
+    leftmost-longest and don't overlap.
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], pattern: Optional[str] = None):
+        self.groups: Dict[str, List[str]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self.groups.setdefault(keyword.lower(), []).append(group)
+        self.regex = re.compile(pattern if pattern is not None else keyword_pattern(self.groups))
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text."""
+        return self.regex.search((text or "").lower()) is not None
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Keyword hits per group (groups without hits are left out)."""
+        hits: Dict[str, int] = {}
+        for keyword in self.regex.findall((text or "").lower()):
+            for group in self.groups[keyword]:
+                hits[group] = hits.get(group, 0) + 1
+        return hits
+
+
+AUTO_SUBJECT_KEYWORDS = [
+    "out of office", "ooo", "automatic reply", "auto-reply", "autoreply",
+    "away from the office", "on vacation", "out of the office",
+    "has accepted this invitation", "has declined this invitation",
+]
+
+AUTO_BODY_PHRASES = [
+    "i am currently out of the office", "i am out of office until",
+    "this is an automatic reply", "this is an auto-reply",
+]
+
+AUTO_SUBJECT_MATCHER = KeywordMatcher({"auto": AUTO_SUBJECT_KEYWORDS})
+AUTO_BODY_MATCHER = KeywordMatcher({"auto": AUTO_BODY_PHRASES})
+
+
+def strip_html(text: str) -> str:
+    return HTML_TAG_RE.sub("", text)
+
+
+def remove_quoted_replies(t: str) -> str:
+    lines = t.splitlines()
+    out = []
+    for line in lines:
+        if QUOTED_REPLY_RE.match(line):
+            break
+        if QUOTE_MARK_RE.match(line):
+            continue
         out.append(line)
     return "\n".join(out).strip()
 
@@ -608,32 +1860,21 @@ def remove_signatures(t: str) -> str:
     return re.sub(r"\n{3,}", "\n\n", t).strip()
 
 
-def cleanse_body(t: str) -> str:
-    if not t:
-        return ""
+# Each cleanse_* step is split around the PII pass so iter_cleaned can
+# batch the anonymization of many records together.
+def _prepare_body(t: str) -> str:
     t = strip_html(t)
     t = remove_quoted_replies(t)
-    t = remove_signatures(t)
-    t = anonymize_pii(t)
-    return re.sub(r"\n{3,}", "\n\n", t).strip()
+    return remove_signatures(t)
 
 
-def cleanse_subject(t: str) -> str:
-    if not t:
-        return ""
-    return anonymize_pii(strip_html(t)).strip()
+def _finish_body(t: str) -> str:
+    return re.sub(r"\n{3,}", "\n\n", t).strip()
 
 
-def cleanse_to_field(t: str) -> str:
-    if not t:
-        return ""
-    parsed = getaddresses([t])
+def _rebuild_to_field(parsed: List[Tuple[str, str]]) -> str:
     rebuilt = []
     for display, addr in parsed:
-        if display:
-            display = anonymize_pii(display)
-        if addr:
-            addr = anonymize_pii(addr)
         if display and addr:
             rebuilt.append(f"{display} <{addr}>")
         elif addr:
@@ -643,6 +1884,28 @@ def cleanse_to_field(t: str) -> str:
     return ", ".join(rebuilt)
 
 
+def cleanse_body(t: str) -> str:
+    if not t:
+        return ""
+    return _finish_body(anonymize_pii(_prepare_body(t)))
+
+
+def cleanse_subject(t: str) -> str:
+    if not t:
+        return ""
+    return anonymize_pii(strip_html(t)).strip()
+
+
+def cleanse_to_field(t: str) -> str:
+    if not t:
+        return ""
+    return _rebuild_to_field([
+        (anonymize_pii(display) if display else display,
+         anonymize_pii(addr, tier=pii_tier_for_address(addr)) if addr else addr)
+        for display, addr in getaddresses([t])
+    ])
+
+
 def parse_date_any(d: Optional[str]) -> Optional[datetime]:
     if not d:
         return None
@@ -660,27 +1923,23 @@ def parse_date_any(d: Optional[str]) -> Optional[datetime]:
 
 
 def get_field(rec: Dict[str, Any], *keys: str):
-    """Case-insensitive field lookup."""
-    if not isinstance(rec, dict):
+    """Case-insensitive field lookup (only the matching values are read)."""
+    if not isinstance(rec, Mapping):
         return None
-    lowered = {k.lower(): v for k, v in rec.items()}
+    lowered = {k.lower(): k for k in rec}
     for key in keys:
         if key in rec and rec[key]:
             return rec[key]
-        if key.lower() in lowered and lowered[key.lower()]:
-            return lowered[key.lower()]
+        original = lowered.get(key.lower())
+        if original is not None and rec[original]:
+            return rec[original]
     return None
 
 
 def is_auto_reply(rec: Dict[str, Any], subject: str, body: str) -> bool:
-    s = (subject or "").lower()
-    if any(k in s for k in AUTO_SUBJECT_KEYWORDS):
+    if AUTO_SUBJECT_MATCHER.search(subject):
         return True
-    b = (body or "").lower()
-    if any(phrase in b for phrase in [
-        "i am currently out of the office", "i am out of office until",
-        "this is an automatic reply", "this is an auto-reply"
-    ]):
+    if AUTO_BODY_MATCHER.search(body):
         return True
     auto_submitted = get_field(rec, "Auto-Submitted", "auto-submitted")
     if auto_submitted and str(auto_submitted).lower() not in ("no", "none"):
@@ -688,136 +1947,705 @@ def is_auto_reply(rec: Dict[str, Any], subject: str, body: str) -> bool:
     return False
 
 
-def iter_records(path: str) -> Iterable[Dict[str, Any]]:
-    """Iterate over JSON array or JSONL file."""
-    with open(path, "r", encoding="utf-8") as f:
+def get_ijson():
+    """
+    Import ijson with the fastest backend available.
+
+    The yajl2_c backend ships in ijson's binary wheels and parses several
+    times faster than the pure-Python fallback ijson picks otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        print("Error: ijson not installed. Run: pip install ijson")
+        sys.exit(1)
+    for name in ("yajl2_c", "yajl2_cffi", "yajl2"):
+        try:
+            return ijson.get_backend(name)
+        except ImportError:
+            continue
+    return ijson
+
+
+def open_records_file(path: str, mode: str = "r"):
+    """Open a record file for reading, decompressing .gz, .bz2 and .xz files."""
+    lower = path.lower()
+    opener = open
+    if lower.endswith(".gz"):
+        opener = gzip.open
+    elif lower.endswith(".bz2"):
+        import bz2
+        opener = bz2.open
+    elif lower.endswith(".xz"):
+        import lzma
+        opener = lzma.open
+    if "b" in mode:
+        return opener(path, mode)
+    return opener(path, mode if opener is open else "rt", encoding="utf-8")
+
+
+def is_json_array_file(path: str) -> bool:
+    """True if the file holds a JSON array rather than JSONL."""
+    with open_records_file(path, "rb") as f:
         first = f.read(1)
-        f.seek(0)
-        if first == "[":
-            data = json.load(f)
-            for rec in data:
+        while first and first.isspace():
+            first = f.read(1)
+        return first == b"["
+
+
+def iter_records(path: str) -> Iterable[Dict[str, Any]]:
+    """
+    Stream records from a JSON array or JSONL file (optionally compressed),
+    or a column store.
+
+    JSON arrays are parsed incrementally with ijson, so memory stays at one
+    record regardless of file size. Column store rows are yielded as
+    ColumnRecords, which decode fields on access; the store is closed when
+    the iteration ends (see ColumnStore.close).
+    """
+    if is_column_store(path):
+        store = ColumnStore(path)
+        try:
+            for row in range(len(store)):
+                yield ColumnRecord(store, row)
+        finally:
+            store.close()
+        return
+    if is_json_array_file(path):
+        ijson = get_ijson()
+        with open_records_file(path, "rb") as f:
+            for rec in ijson.items(f, "item", use_float=True):
                 if isinstance(rec, dict):
                     yield rec
-        else:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    rec = json.loads(line)
-                    if isinstance(rec, dict):
-                        yield rec
-                except Exception:
-                    continue
+        return
+    with open_records_file(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+                if isinstance(rec, dict):
+                    yield rec
+            except Exception:
+                continue
+
+
+def iter_records_with_offsets(path: str, start: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Iterate over a JSONL file from byte offset `start`.
+
+    Yields each record with the byte offset just past its line, i.e. where
+    a later read should start to continue after that record. Offsets in a
+    .gz file are positions in the decompressed stream.
+    """
+    with open_records_file(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        for line in f:
+            pos += len(line)
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict):
+                yield rec, pos
+
+
+def _filter_headers(
+    rec: Dict[str, Any],
+    stats: Dict[str, int],
+    sender_email: Optional[str],
+    cutoff: datetime
+) -> Optional[str]:
+    """
+    Apply the sender and date filters, which never read the body.
+
+    Returns the sender address for records that pass, or None (with the
+    matching skip counter bumped in `stats`).
+    """
+    # Sender filter
+    sender_raw = get_field(rec, "From", "from", "Sender", "sender", "emailFrom", "email_from")
+    sender_addr = parseaddr(str(sender_raw or ""))[1].lower()
+    if sender_email and sender_addr != sender_email.lower():
+        stats["skipped_sender"] += 1
+        return None
+
+    # Date filter
+    dt = None
+    for k in ("Date", "date", "sent", "sentAt", "created_at", "createdAt"):
+        v = get_field(rec, k)
+        if v:
+            dt = parse_date_any(v)
+            if dt:
+                break
+    if dt is None or dt < cutoff:
+        stats["skipped_date"] += 1
+        return None
+    return sender_addr
+
+
+def _filter_content(
+    rec: Dict[str, Any],
+    sender_addr: str,
+    stats: Dict[str, int]
+) -> Optional[Tuple[Dict[str, Any], str, Any, Any, Any]]:
+    """
+    Apply the auto-reply filter to a record that passed _filter_headers.
+
+    Returns (rec, sender_addr, subject, body, to) for records that should be
+    cleaned, or None (with stats['skipped_auto'] bumped).
+    """
+    subj_raw = get_field(rec, "Subject", "subject") or ""
+    body_raw = get_field(rec, "Body", "body", "Text", "text", "Content", "content") or ""
+    to_raw = get_field(rec, "To", "to", "Recipient", "recipient") or ""
+
+    # Auto-reply filter
+    if is_auto_reply(rec, subj_raw, body_raw):
+        stats["skipped_auto"] += 1
+        return None
+
+    return rec, sender_addr, subj_raw, body_raw, to_raw
+
+
+def _filter_for_cleaning(
+    rec: Dict[str, Any],
+    stats: Dict[str, int],
+    sender_email: Optional[str],
+    cutoff: datetime
+) -> Optional[Tuple[Dict[str, Any], str, Any, Any, Any]]:
+    """
+    Apply the sender, date and auto-reply filters to one record.
+
+    Returns (rec, sender_addr, subject, body, to) for records that should be
+    cleaned, or None (with the matching skip counter bumped in `stats`).
+    """
+    sender_addr = _filter_headers(rec, stats, sender_email, cutoff)
+    if sender_addr is None:
+        return None
+    return _filter_content(rec, sender_addr, stats)
+
+
+def _clean_batch(
+    pending: List[Tuple[Dict[str, Any], str, Any, Any, Any]],
+    stats: Dict[str, int],
+    batch_size: int = PII_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Clean and anonymize a batch of filtered records (see _filter_for_cleaning).
+
+    Every body, subject, display name and address in the batch is gathered
+    into one list per detection tier for anonymize_pii_batch, then mapped
+    back to its record. Bare email addresses skip the spaCy pass.
+    """
+    texts: List[str] = []
+    tiers: List[str] = []
+
+    def slot(text: str, tier: str = PII_TIER_NER) -> int:
+        texts.append(text)
+        tiers.append(tier)
+        return len(texts) - 1
+
+    layout = []
+    for rec, sender_addr, subj_raw, body_raw, to_raw in pending:
+        body_slot = slot(_prepare_body(body_raw)) if body_raw else None
+        subject_slot = slot(strip_html(subj_raw)) if subj_raw else None
+        to_slots = [
+            (slot(display) if display else None, slot(addr, pii_tier_for_address(addr)) if addr else None)
+            for display, addr in (getaddresses([to_raw]) if to_raw else [])
+        ]
+        layout.append((rec, sender_addr, body_slot, subject_slot, to_slots))
+
+    cleaned = list(texts)
+    for tier in (PII_TIER_NER, PII_TIER_PATTERNS):
+        indexes = [i for i, t in enumerate(tiers) if t == tier]
+        if indexes:
+            results = anonymize_pii_batch([texts[i] for i in indexes], batch_size=batch_size, stats=stats, tier=tier)
+            for i, text in zip(indexes, results):
+                cleaned[i] = text
+
+    for rec, sender_addr, body_slot, subject_slot, to_slots in layout:
+        body_clean = _finish_body(cleaned[body_slot]) if body_slot is not None else ""
+        subject_clean = cleaned[subject_slot].strip() if subject_slot is not None else ""
+        to_clean = _rebuild_to_field([
+            (cleaned[display] if display is not None else "", cleaned[addr] if addr is not None else "")
+            for display, addr in to_slots
+        ])
+
+        if not subject_clean and not body_clean:
+            stats["skipped_empty"] += 1
+            continue
+
+        msg_id = get_field(rec, "Message-ID", "Message-Id", "MessageId", "message_id") or ""
+
+        stats["kept"] += 1
+        yield {
+            "Message-ID": msg_id.strip() if msg_id else None,
+            "Sender": sender_addr,
+            "To": to_clean,
+            "Subject": subject_clean,
+            "Body": body_clean
+        }
+
+
+# Records per task when the clean stage is spread over worker processes;
+# a task is also closed once its text reaches CLEAN_CHUNK_CHARS, so a few
+# giant threads can't turn one task into a straggler
+CLEAN_CHUNK_RECORDS = 512
+CLEAN_CHUNK_CHARS = 1_000_000
+
+# clean_emails records a resume checkpoint at most this many input records apart
+CLEAN_CHECKPOINT_RECORDS = 5000
+
+
+def _clean_records_chunk(
+    task: Tuple[List[Tuple[Dict[str, Any], str]], Dict[str, int], int, Optional[Tuple[str, int]], str]
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Process-pool worker: clean one chunk of records.
+
+    The chunk holds (record, sender address) pairs that already passed
+    _filter_headers in the parent, along with the parent's counters for the
+    records it read to fill the chunk. Each worker process builds its own
+    Presidio engines on first use (via get_analyzer), then keeps them for
+    every later chunk it is given. The parent's PII cache settings and
+    model tier travel with the task.
+    """
+    records, scanned, batch_size, cache_settings, pii_model = task
+    configure_pii_model(pii_model)
+    if cache_settings:
+        configure_pii_cache(*cache_settings)
+    else:
+        configure_pii_cache(None)
+    stats = dict(scanned, skipped_auto=0, skipped_empty=0, kept=0)
+    pending = [item for item in (_filter_content(rec, addr, stats) for rec, addr in records) if item]
+    cleaned = []
+    for i in range(0, len(pending), batch_size):
+        cleaned.extend(_clean_batch(pending[i:i + batch_size], stats, batch_size))
+    return cleaned, stats
+
+
+def _iter_filtered_chunks(
+    records: Iterable[Dict[str, Any]],
+    sender_email: Optional[str],
+    cutoff: datetime,
+    size: int,
+    max_chars: int = CLEAN_CHUNK_CHARS
+) -> Iterator[Tuple[List[Tuple[Dict[str, Any], str]], Dict[str, int]]]:
+    """
+    Group records into worker chunks, running the header filters on the way.
+
+    Only records that pass are copied into plain dicts for the workers, so
+    column store rows the sender or date filter drops never have their
+    bodies decoded. A chunk closes after `size` records are read or once
+    its text reaches max_chars.
+    """
+    def fresh() -> Dict[str, int]:
+        return {"total": 0, "skipped_sender": 0, "skipped_date": 0}
+
+    chunk: List[Tuple[Dict[str, Any], str]] = []
+    scanned = fresh()
+    chars = 0
+    for rec in records:
+        scanned["total"] += 1
+        sender_addr = _filter_headers(rec, scanned, sender_email, cutoff)
+        if sender_addr is not None:
+            rec = dict(rec)
+            chunk.append((rec, sender_addr))
+            chars += sum(len(v) for v in rec.values() if isinstance(v, str))
+        if scanned["total"] >= size or chars >= max_chars:
+            yield chunk, scanned
+            chunk = []
+            scanned = fresh()
+            chars = 0
+    if scanned["total"]:
+        yield chunk, scanned
+
+
+def iter_cleaned(
+    records: Iterable[Dict[str, Any]],
+    stats: Dict[str, int],
+    sender_email: Optional[str] = None,
+    years: int = 5,
+    quiet: bool = False,
+    batch_size: int = PII_BATCH_SIZE,
+    workers: int = 1,
+    on_drain: Optional[Callable[[], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Clean and anonymize a stream of records, yielding cleaned emails.
+
+    Records that pass the filters are anonymized batch_size at a time, so
+    spaCy sees many texts per call; output order matches input order.
+    With workers > 1, chunks of records are cleaned in a process pool and
+    yielded back in input order.
+
+    Counters in `stats` (total, kept, skipped_sender, skipped_date,
+    skipped_auto, skipped_empty, and pii_cache_hits / pii_cache_misses
+    when the PII cache is on) are updated in place.
+
+    on_drain, if given, is called whenever every one of the first
+    stats['total'] records has been fully handled and its output (if any)
+    consumed, which makes it a safe point to checkpoint.
+    """
+    cutoff = datetime.utcnow().replace(year=datetime.utcnow().year - years)
+    for key in ("total", "kept", "skipped_sender", "skipped_date", "skipped_auto", "skipped_empty"):
+        stats.setdefault(key, 0)
+
+    if workers > 1:
+        tasks = (
+            (chunk, scanned, batch_size, _pii_cache_settings, _pii_model)
+            for chunk, scanned in _iter_filtered_chunks(records, sender_email, cutoff, CLEAN_CHUNK_RECORDS)
+        )
+        for cleaned, chunk_stats in _ordered_pool_map(_clean_records_chunk, tasks, workers):
+            for key, value in chunk_stats.items():
+                stats[key] = stats.get(key, 0) + value
+            if not quiet:
+                print(f"      {stats['total']:,} scanned, {stats['kept']:,} kept...", flush=True)
+            yield from cleaned
+            if on_drain:
+                on_drain()
+        return
+
+    pending = []
+    for rec in records:
+        stats["total"] += 1
+
+        if not quiet and stats["total"] % 100 == 0:
+            print(f"      {stats['total']:,} scanned, {stats['kept']:,} kept...", flush=True)
+
+        item = _filter_for_cleaning(rec, stats, sender_email, cutoff)
+        if item is None:
+            continue
+        pending.append(item)
+        if len(pending) >= batch_size:
+            yield from _clean_batch(pending, stats, batch_size)
+            pending = []
+            if on_drain:
+                on_drain()
+
+    if pending:
+        yield from _clean_batch(pending, stats, batch_size)
+
+
+def _print_clean_summary(stats: Dict[str, int]) -> None:
+    print(f"\n   {'─'*50}")
+    print(f"   📊 CLEANING SUMMARY:")
+    print(f"      Total scanned:    {stats['total']:,}")
+    print(f"      ✓ Kept:           {stats['kept']:,}")
+    if stats['skipped_sender'] > 0:
+        print(f"      ✗ Wrong sender:   {stats['skipped_sender']:,}")
+    if stats['skipped_date'] > 0:
+        print(f"      ✗ Too old:        {stats['skipped_date']:,}")
+    if stats['skipped_auto'] > 0:
+        print(f"      ✗ Auto-replies:   {stats['skipped_auto']:,}")
+    if stats['skipped_empty'] > 0:
+        print(f"      ✗ Empty:          {stats['skipped_empty']:,}")
+    lookups = stats.get('pii_cache_hits', 0) + stats.get('pii_cache_misses', 0)
+    if lookups:
+        print(f"      ⚡ PII cache hits: {stats['pii_cache_hits']:,} of {lookups:,} texts")
+
+
+def clean_checkpoint_path(output_path: str) -> str:
+    """Path of the resume checkpoint written next to a clean output."""
+    return output_path + ".checkpoint.json"
+
+
+def _load_clean_checkpoint(
+    output_path: str,
+    input_fingerprint: str,
+    params: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Load the clean checkpoint if it belongs to this input, parameters and output."""
+    try:
+        with open(clean_checkpoint_path(output_path), "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if (checkpoint.get("version") != PIPELINE_VERSION or checkpoint.get("input") != input_fingerprint
+                or checkpoint.get("params") != params):
+            return None
+        if os.path.getsize(output_path) < checkpoint["output_offset"]:
+            return None
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+    return checkpoint
 
 
 def clean_emails(
     input_path: str,
-    output_path: str = "cleaned_emails.json",
+    output_path: str = "cleaned_emails.jsonl",
     sender_email: Optional[str] = None,
     years: int = 5,
-    quiet: bool = False
+    quiet: bool = False,
+    batch_size: int = PII_BATCH_SIZE,
+    workers: int = 1,
+    resume: bool = True
 ) -> Dict[str, int]:
     """
     Clean and anonymize emails using Presidio.
 
+    Cleaned emails are appended to the output as they are produced, and
+    every CLEAN_CHECKPOINT_RECORDS input records a checkpoint (input
+    position, output offset and stats) is saved next to the output. A run
+    that is interrupted picks up from the last checkpoint when started
+    again with the same input and parameters.
+
     Args:
-        input_path: Path to input JSON or JSONL file
-        output_path: Path to output JSON file
+        input_path: Path to input JSON or JSONL file, or column store
+        output_path: Path to output JSONL file (.jsonl.gz to compress it,
+            .json for a JSON array, .cols for a column store, which is
+            written on completion and so is not checkpointed)
         sender_email: Only keep emails from this sender (None = keep all)
         years: Only keep emails from the past N years
         quiet: If True, suppress progress output
+        batch_size: Texts per spaCy batch during PII detection
+        workers: Number of processes; each loads its own PII engine
+        resume: If True, continue from a matching checkpoint if one exists
 
     Returns:
         Statistics dict
     """
-    cutoff = datetime.utcnow().replace(year=datetime.utcnow().year - years)
-    stats = {"total": 0, "kept": 0, "skipped_sender": 0, "skipped_date": 0, "skipped_auto": 0, "skipped_empty": 0}
-    results: List[Dict[str, Any]] = []
+    params = clean_params(sender_email, years)
+    input_fingerprint = fingerprint_input(input_path)
+    checkpoint_path = clean_checkpoint_path(output_path)
+    checkpointing = not is_column_store(output_path)
+    checkpoint = None
+    if resume and checkpointing:
+        checkpoint = _load_clean_checkpoint(output_path, input_fingerprint, params)
+    if checkpoint is None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    stats: Dict[str, Any] = dict(checkpoint["stats"]) if checkpoint else {}
 
     if not quiet:
-        print(f"   🔒 Loading PII detection engine...")
+        print(f"   🔒 Loading PII detection engine ({_pii_model})...")
     _ = get_analyzer()
     if not quiet:
         if sender_email:
             print(f"   📧 Filtering to sender: {sender_email}")
         print(f"   📅 Keeping emails from past {years} years")
+        if workers > 1:
+            print(f"   ⚡ Cleaning with {workers} workers")
+        if checkpoint:
+            print(f"   ⏩ Resuming after {checkpoint['records']:,} records ({stats['kept']:,} already kept)")
         print(f"   ⏳ Processing...")
 
-    for rec in iter_records(input_path):
-        stats["total"] += 1
+    # Byte offset in a JSONL input just past each record read so far, keyed
+    # by record number, so a checkpoint can record where to seek on resume
+    jsonl = not is_column_store(input_path) and not is_json_array_file(input_path)
+    offsets: Dict[int, int] = {}
+    last_checkpoint = checkpoint["records"] if checkpoint else 0
+
+    def records() -> Iterator[Dict[str, Any]]:
+        if not jsonl:
+            yield from itertools.islice(iter_records(input_path), last_checkpoint, None)
+            return
+        n = last_checkpoint
+        start = checkpoint["input_offset"] if checkpoint else 0
+        for rec, end in iter_records_with_offsets(input_path, start):
+            n += 1
+            offsets[n] = end
+            yield rec
+
+    def save_checkpoint() -> None:
+        nonlocal last_checkpoint
+        done = stats["total"]
+        if not checkpointing or done - last_checkpoint < CLEAN_CHECKPOINT_RECORDS:
+            return
+        output_offset, written = writer.checkpoint()
+        _write_json_atomic(checkpoint_path, {
+            "version": PIPELINE_VERSION,
+            "input": input_fingerprint,
+            "params": params,
+            "records": done,
+            "input_offset": offsets[done] if jsonl else None,
+            "output_offset": output_offset,
+            "written": written,
+            "stats": stats,
+        })
+        for n in [n for n in offsets if n <= done]:
+            del offsets[n]
+        last_checkpoint = done
 
-        if not quiet and stats["total"] % 100 == 0:
-            print(f"      {stats['total']:,} scanned, {len(results):,} kept...", flush=True)
+    resume_at = (checkpoint["output_offset"], checkpoint["written"]) if checkpoint else None
+    with open_record_writer(output_path, resume=resume_at) as writer:
+        for rec in iter_cleaned(records(), stats, sender_email, years, quiet, batch_size, workers,
+                                on_drain=save_checkpoint):
+            writer.write(rec)
+    close_pii_cache()
 
-        # Sender filter
-        sender_raw = get_field(rec, "From", "from", "Sender", "sender", "emailFrom", "email_from")
-        sender_addr = parseaddr(str(sender_raw or ""))[1].lower()
-        if sender_email and sender_addr != sender_email.lower():
-            stats["skipped_sender"] += 1
-            continue
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    write_stage_manifest("clean", input_path, output_path, params, writer.count)
 
-        # Date filter
-        dt = None
-        for k in ("Date", "date", "sent", "sentAt", "created_at", "createdAt"):
-            v = get_field(rec, k)
-            if v:
-                dt = parse_date_any(v)
-                if dt:
-                    break
-        if dt is None or dt < cutoff:
-            stats["skipped_date"] += 1
-            continue
+    if not quiet:
+        _print_clean_summary(stats)
+        print(f"   💾 Saved to: {os.path.basename(output_path)}")
+
+    stats["output"] = output_path
+    return stats
 
-        subj_raw = get_field(rec, "Subject", "subject") or ""
-        body_raw = get_field(rec, "Body", "body", "Text", "text", "Content", "content") or ""
-        to_raw = get_field(rec, "To", "to", "Recipient", "recipient") or ""
 
-        # Auto-reply filter
-        if is_auto_reply(rec, subj_raw, body_raw):
-            stats["skipped_auto"] += 1
-            continue
+# =============================================================================
+# PII MODEL BENCHMARK
+# =============================================================================
 
-        # Clean and anonymize
-        body_clean = cleanse_body(body_raw)
-        subject_clean = cleanse_subject(subj_raw)
-        to_clean = cleanse_to_field(to_raw)
+# Labeled email snippets for comparing model tiers: (text, [(entity, span text)])
+PII_BENCHMARK_FIXTURE = [
+    ("Hi Sarah, thanks for sending the deck over. Let's sync Thursday.",
+     [("PERSON", "Sarah")]),
+    ("Looping in Michael Torres from finance, he can approve the budget.",
+     [("PERSON", "Michael Torres")]),
+    ("I'll be in Chicago next week for the client workshop.",
+     [("LOCATION", "Chicago")]),
+    ("You can reach me at 415-555-0132 or on my cell after 6pm.",
+     [("PHONE_NUMBER", "415-555-0132")]),
+    ("Please send the signed contract to jessica.wong@northwindtraders.com by Friday.",
+     [("EMAIL_ADDRESS", "jessica.wong@northwindtraders.com")]),
+    ("The draft is up at https://docs.example.com/d/8f3k2 if you want to comment.",
+     [("URL", "https://docs.example.com/d/8f3k2")]),
+    ("David and Priya both flagged the same issue with the timeline.",
+     [("PERSON", "David"), ("PERSON", "Priya")]),
+    ("We moved the offsite from Denver to Austin, Texas because of the weather.",
+     [("LOCATION", "Denver"), ("LOCATION", "Austin"), ("LOCATION", "Texas")]),
+    ("My card ending is fine, the full number is 4111 1111 1111 1111 if they need it.",
+     [("CREDIT_CARD", "4111 1111 1111 1111")]),
+    ("The VPN drops whenever I connect from 192.168.14.201 at home.",
+     [("IP_ADDRESS", "192.168.14.201")]),
+    ("Talked to Dr. Emily Nakamura this morning and she is on board.",
+     [("PERSON", "Emily Nakamura")]),
+    ("Can you forward this to Tom? He's handling the London launch.",
+     [("PERSON", "Tom"), ("LOCATION", "London")]),
+    ("Call the front desk at (212) 555-0187 and ask for Maria Gonzalez.",
+     [("PHONE_NUMBER", "(212) 555-0187"), ("PERSON", "Maria Gonzalez")]),
+    ("Thanks Kevin! I really appreciate you jumping on this so quickly.",
+     [("PERSON", "Kevin")]),
+    ("Flights to Berlin are cheaper if we go through Amsterdam.",
+     [("LOCATION", "Berlin"), ("LOCATION", "Amsterdam")]),
+    ("Rachel Kim asked whether the Seattle office can host the review.",
+     [("PERSON", "Rachel Kim"), ("LOCATION", "Seattle")]),
+    ("Send questions to support@acme-widgets.io and cc alex@acme-widgets.io.",
+     [("EMAIL_ADDRESS", "support@acme-widgets.io"), ("EMAIL_ADDRESS", "alex@acme-widgets.io")]),
+    ("Jordan said the numbers look right, but Chris wants another pass.",
+     [("PERSON", "Jordan"), ("PERSON", "Chris")]),
+    ("I'm driving up to Portland, Oregon for the weekend.",
+     [("LOCATION", "Portland"), ("LOCATION", "Oregon")]),
+    ("Our new hire, Aisha Patel, starts Monday in the Toronto office.",
+     [("PERSON", "Aisha Patel"), ("LOCATION", "Toronto")]),
+    ("The dashboard lives at www.metrics-board.net/team/q3 now.",
+     [("URL", "www.metrics-board.net/team/q3")]),
+    ("Text me at +1 646 555 0199 when you land in Boston.",
+     [("PHONE_NUMBER", "+1 646 555 0199"), ("LOCATION", "Boston")]),
+    ("Great catch, Ben. Let's loop in Olivia before we ship.",
+     [("PERSON", "Ben"), ("PERSON", "Olivia")]),
+    ("Mom and I are visiting Lisbon and Porto in May.",
+     [("LOCATION", "Lisbon"), ("LOCATION", "Porto")]),
+    # Weak patterns that only pass the threshold with a context word nearby
+    ("The travel desk needs my passport number, it's 912803456.",
+     [("US_PASSPORT", "912803456")]),
+    ("HR has my social security number down as 431-870215, can you fix it?",
+     [("US_SSN", "431-870215")]),
+    ("The rental form wants my driver license, D4082217, before pickup.",
+     [("US_DRIVER_LICENSE", "D4082217")]),
+]
 
-        if not subject_clean and not body_clean:
-            stats["skipped_empty"] += 1
-            continue
 
-        msg_id = get_field(rec, "Message-ID", "Message-Id", "MessageId", "message_id") or ""
+def _benchmark_spans() -> List[Tuple[str, List[Tuple[str, int, int]]]]:
+    fixture = []
+    for text, labels in PII_BENCHMARK_FIXTURE:
+        spans = []
+        for entity, span in labels:
+            start = text.index(span)
+            spans.append((entity, start, start + len(span)))
+        fixture.append((text, spans))
+    return fixture
 
-        results.append({
-            "Message-ID": msg_id.strip() if msg_id else None,
-            "Sender": sender_addr,
-            "To": to_clean,
-            "Subject": subject_clean,
-            "Body": body_clean
-        })
 
-    stats["kept"] = len(results)
+def benchmark_pii_models(
+    models: Optional[List[str]] = None,
+    repeat: int = 20,
+    score_threshold: float = 0.4,
+    quiet: bool = False
+) -> Dict[str, Any]:
+    """
+    Measure recall and throughput of each PII model tier on a labeled fixture.
+
+    A labeled span counts as found when a detection of the same entity type
+    overlaps it. Throughput is measured over `repeat` passes of the fixture,
+    with the PII cache bypassed.
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    Args:
+        models: Tiers to compare (default: all of PII_MODELS)
+        repeat: Passes over the fixture for the throughput measurement
+        score_threshold: Presidio score threshold, as used by the clean stage
+        quiet: If True, suppress progress output
+
+    Returns:
+        Dict of per-model results (skipped tiers have "available": False)
+    """
+    import time
+
+    fixture = _benchmark_spans()
+    texts = [text for text, _ in fixture]
+    chars = sum(len(t) for t in texts)
+    previous = _pii_model
+    results: Dict[str, Any] = {}
 
     if not quiet:
-        print(f"\n   {'─'*50}")
-        print(f"   📊 CLEANING SUMMARY:")
-        print(f"      Total scanned:    {stats['total']:,}")
-        print(f"      ✓ Kept:           {stats['kept']:,}")
-        if stats['skipped_sender'] > 0:
-            print(f"      ✗ Wrong sender:   {stats['skipped_sender']:,}")
-        if stats['skipped_date'] > 0:
-            print(f"      ✗ Too old:        {stats['skipped_date']:,}")
-        if stats['skipped_auto'] > 0:
-            print(f"      ✗ Auto-replies:   {stats['skipped_auto']:,}")
-        if stats['skipped_empty'] > 0:
-            print(f"      ✗ Empty:          {stats['skipped_empty']:,}")
-        print(f"   💾 Saved to: {os.path.basename(output_path)}")
+        print(f"\n{'='*60}")
+        print(f"🧪 PII MODEL BENCHMARK ({len(texts)} texts, {sum(len(s) for _, s in fixture)} labeled spans)")
+        print(f"{'='*60}")
 
-    stats["output"] = output_path
-    return stats
+    try:
+        for name in models or list(PII_MODELS):
+            if not pii_model_available(name):
+                results[name] = {"available": False}
+                if not quiet:
+                    print(f"\n   ⏭️  {name}: {PII_MODELS[name]} not installed "
+                          f"(python -m spacy download {PII_MODELS[name]})")
+                continue
+
+            configure_pii_model(name)
+            started = time.perf_counter()
+            get_analyzer()
+            load_seconds = time.perf_counter() - started
+
+            found: Dict[str, List[int]] = {}
+            detections = analyze_pii_batch(texts, score_threshold)
+            for (text, spans), detected in zip(fixture, detections):
+                for entity, start, end in spans:
+                    hit = any(d.entity_type == entity and d.start < end and d.end > start for d in detected)
+                    counts = found.setdefault(entity, [0, 0])
+                    counts[0] += hit
+                    counts[1] += 1
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                analyze_pii_batch(texts, score_threshold)
+            elapsed = time.perf_counter() - started
+
+            total_hits = sum(h for h, _ in found.values())
+            total_spans = sum(n for _, n in found.values())
+            results[name] = {
+                "available": True,
+                "load_seconds": round(load_seconds, 3),
+                "recall": round(total_hits / total_spans, 3),
+                "recall_by_entity": {e: round(h / n, 3) for e, (h, n) in sorted(found.items())},
+                "texts_per_second": round(repeat * len(texts) / elapsed, 1),
+                "chars_per_second": round(repeat * chars / elapsed),
+            }
+
+            if not quiet:
+                r = results[name]
+                print(f"\n   🔍 {name} ({PII_MODELS[name] or 'pattern recognizers only'})")
+                print(f"      Load time:   {r['load_seconds']:.2f}s")
+                print(f"      Throughput:  {r['texts_per_second']:,.0f} texts/s ({r['chars_per_second']:,} chars/s)")
+                print(f"      Recall:      {r['recall']:.0%}")
+                for entity, recall in r["recall_by_entity"].items():
+                    print(f"         {entity:<17} {recall:.0%}")
+    finally:
+        configure_pii_model(previous)
+
+    return results
 
 
 # =============================================================================
@@ -840,12 +2668,134 @@ TOPIC_KEYWORDS = {
 }
 
 
+class Taxonomy:
+    """
+    Topic keywords and boring-subject keywords, compiled into matchers.
+
+    Topics are tried in order: the topic with the most keyword hits wins,
+    earlier topics winning ties. `fingerprint` identifies the keyword set
+    in stage manifests ("builtin" for the module defaults).
+    """
+
+    def __init__(
+        self,
+        topics: Mapping[str, List[str]],
+        boring: List[str],
+        fingerprint: str = "builtin",
+        patterns: Optional[Tuple[str, str]] = None
+    ):
+        self.topics = {topic: list(keywords) for topic, keywords in topics.items()}
+        self.boring = list(boring)
+        self.fingerprint = fingerprint
+        topic_pattern, boring_pattern = patterns or (None, None)
+        self.topic_matcher = KeywordMatcher(self.topics, topic_pattern)
+        self.boring_matcher = KeywordMatcher({"boring": self.boring}, boring_pattern)
+
+    def scores(self, subject: str, body: str) -> Dict[str, int]:
+        return self.topic_matcher.counts((subject or "") + " " + (body or ""))
+
+    def label(self, subject: str, body: str) -> str:
+        scores = self.scores(subject, body)
+        if not scores:
+            return "other"
+        return max(self.topics, key=lambda topic: scores.get(topic, 0))
+
+    def is_boring(self, subject: str) -> bool:
+        return self.boring_matcher.search(subject)
+
+
+DEFAULT_TAXONOMY = Taxonomy(TOPIC_KEYWORDS, BORING_KEYWORDS)
+
+# Compiled taxonomies, keyed by the SHA-256 of the taxonomy file
+TAXONOMY_CACHE_DIR = CACHE_DIR / "taxonomies"
+TAXONOMY_CACHE_VERSION = 1
+
+DEFAULT_TAXONOMY_PATH = os.environ.get("VOICE_SYNTH_TAXONOMY") or None
+
+_taxonomy = DEFAULT_TAXONOMY
+
+
+def _parse_taxonomy(path: str, data: bytes) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Validate a taxonomy file: {"topics": {name: [keywords]}, "boring": [keywords]}."""
+    if path.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            print("Error: PyYAML not installed (needed for YAML taxonomies). Run: pip install pyyaml")
+            sys.exit(1)
+        spec = yaml.safe_load(data)
+    else:
+        spec = json.loads(data)
+
+    if not isinstance(spec, dict) or not isinstance(spec.get("topics"), dict) or not spec["topics"]:
+        raise ValueError(f"{path}: expected a \"topics\" mapping of topic name to keywords")
+    topics = {}
+    for topic, keywords in spec["topics"].items():
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        if not isinstance(keywords, list) or not all(isinstance(k, str) and k.strip() for k in keywords):
+            raise ValueError(f"{path}: topic {topic!r} needs a list of non-empty keywords")
+        topics[str(topic)] = keywords
+    boring = spec.get("boring", BORING_KEYWORDS)
+    if not isinstance(boring, list) or not all(isinstance(k, str) and k.strip() for k in boring):
+        raise ValueError(f"{path}: \"boring\" must be a list of non-empty keywords")
+    return topics, boring
+
+
+def load_taxonomy(path: str) -> Taxonomy:
+    """
+    Load a JSON or YAML taxonomy file, compiled matchers included.
+
+    The compiled form (keywords plus both keyword_pattern regexes) is
+    cached in TAXONOMY_CACHE_DIR under the file's SHA-256, so an unchanged
+    file skips parsing and regex building on later runs; any edit changes
+    the hash and recompiles.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    cache_path = TAXONOMY_CACHE_DIR / f"{digest}.json"
+
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == TAXONOMY_CACHE_VERSION:
+            return Taxonomy(cached["topics"], cached["boring"], digest,
+                            (cached["topic_pattern"], cached["boring_pattern"]))
+    except (OSError, ValueError, KeyError):
+        pass
+
+    topics, boring = _parse_taxonomy(path, data)
+    taxonomy = Taxonomy(topics, boring, digest)
+    try:
+        TAXONOMY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(str(cache_path), {
+            "version": TAXONOMY_CACHE_VERSION,
+            "topics": taxonomy.topics,
+            "boring": taxonomy.boring,
+            "topic_pattern": taxonomy.topic_matcher.regex.pattern,
+            "boring_pattern": taxonomy.boring_matcher.regex.pattern,
+        })
+    except OSError:
+        pass
+    return taxonomy
+
+
+def configure_taxonomy(path: Optional[str]) -> Taxonomy:
+    """Use the taxonomy file at `path` for topic labels and the boring filter (None = built-in)."""
+    global _taxonomy
+    _taxonomy = load_taxonomy(path) if path else DEFAULT_TAXONOMY
+    return _taxonomy
+
+
+def topic_scores(subject: str, body: str) -> Dict[str, int]:
+    """Keyword hits per topic in the subject and body (one scan)."""
+    return _taxonomy.scores(subject, body)
+
+
 def label_topic(subject: str, body: str) -> str:
-    text = ((subject or "") + " " + (body or "")).lower()
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        if any(w in text for w in keywords):
-            return topic
-    return "other"
+    """The topic with the most keyword hits (earlier topics win ties), or "other"."""
+    return _taxonomy.label(subject, body)
 
 
 def richness_score(body: str) -> int:
@@ -859,7 +2809,7 @@ def is_style_candidate(email: Dict[str, Any], min_chars: int = 200) -> bool:
     body = email.get("Body") or ""
     to_field = email.get("To") or ""
 
-    if not subject or any(w in subject.lower() for w in BORING_KEYWORDS):
+    if not subject or _taxonomy.is_boring(subject):
         return False
     if len(body.strip()) < min_chars:
         return False
@@ -869,88 +2819,784 @@ def is_style_candidate(email: Dict[str, Any], min_chars: int = 200) -> bool:
     return True
 
 
-def deduplicate_emails(
-    candidates: List[Dict[str, Any]],
-    threshold: float = 0.8,
-    quiet: bool = False
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+MINHASH_NUM_PERM = 128
+
+# Bodies per MinHash task; with workers > 1 each task goes to a worker process
+DEDUPE_CHUNK_DOCS = 256
+
+
+def shingles(body_normalized: str) -> List[bytes]:
+    """3-word shingles of a normalized body, as hashed into its MinHash."""
+    words = body_normalized.split()
+    return [' '.join(words[i:i+3]).encode('utf8') for i in range(max(1, len(words) - 2))]
+
+
+def minhash_signatures(bodies: List[str], num_perm: int = MINHASH_NUM_PERM) -> List[Any]:
     """
-    Remove exact and near-duplicate emails, keeping the richest version.
+    MinHash signatures (hash value arrays) of normalized bodies.
 
-    Uses two-level deduplication:
-    1. Exact hash match (SHA-256 of normalized body)
-    2. MinHash LSH for near-duplicates (Jaccard similarity)
+    Each body's shingles go through MinHash.update_batch, which permutes
+    all of them in one NumPy operation, and MinHash.generator reuses one set
+    of permutation parameters instead of regenerating it per body. The
+    values are identical to calling update() once per shingle.
+    """
+    from datasketch import MinHash
+    return [m.hashvalues for m in MinHash.generator((shingles(b) for b in bodies), num_perm=num_perm)]
 
-    Args:
-        candidates: List of email dicts with Body field
-        threshold: Jaccard similarity threshold for near-duplicates (0.0-1.0)
-        quiet: If True, suppress progress output
 
-    Returns:
-        Tuple of (deduplicated_list, stats_dict)
+DEDUPE_INDEX_FILENAME = "dedupe_index.sqlite3"
+
+
+class DedupeIndex:
     """
-    try:
-        from datasketch import MinHash, MinHashLSH
-        has_datasketch = True
-    except ImportError:
-        has_datasketch = False
-        if not quiet:
-            print("Warning: datasketch not installed, using exact-match only")
+    Persistent MinHash LSH band index for near-duplicate detection.
 
-    # Sort by richness descending so we keep the best version first
-    sorted_candidates = sorted(
-        candidates,
-        key=lambda e: richness_score(e.get("Body", "")),
-        reverse=True
-    )
+    Emails are keyed by the SHA-256 of their normalized body, which is
+    unique once exact duplicates are dropped and stable across runs, so a
+    body indexed by an earlier curate run is never hashed again. Each
+    signature is split into `bands` bands of `rows` values, as in
+    datasketch's MinHashLSH; emails sharing a band bucket are
+    near-duplicate candidates.
+
+    Stored as SQLite (":memory:" for a throwaway index). An index built
+    with a different band layout or MinHash scheme is cleared on open.
+    """
+
+    def __init__(self, path: str, bands: int, rows: int, scheme: str):
+        import sqlite3
+
+        self.path = path
+        self.bands = bands
+        self.rows = rows
+        self.conn = sqlite3.connect(path)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS docs (key BLOB PRIMARY KEY) WITHOUT ROWID")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS bands (bucket INTEGER NOT NULL, key BLOB NOT NULL, "
+            "PRIMARY KEY (bucket, key)) WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS bands_key ON bands (key)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        layout = json.dumps({"bands": bands, "rows": rows, "scheme": scheme})
+        row = self.conn.execute("SELECT value FROM meta WHERE name = 'layout'").fetchone()
+        if row and row[0] != layout:
+            self.conn.execute("DELETE FROM docs")
+            self.conn.execute("DELETE FROM bands")
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('layout', ?)", (layout,))
+        self.conn.commit()
+
+    def known(self, keys: List[bytes]) -> Set[bytes]:
+        """The subset of keys that are already indexed."""
+        found: Set[bytes] = set()
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            found.update(k for (k,) in self.conn.execute(
+                f"SELECT key FROM docs WHERE key IN ({placeholders})", batch))
+        return found
+
+    def buckets(self, hashvalues) -> List[int]:
+        """One bucket id per band: a 64-bit hash of the band number and its values."""
+        return [
+            int.from_bytes(hashlib.blake2b(
+                struct.pack("<H", band) + hashvalues[band * self.rows:(band + 1) * self.rows].tobytes(),
+                digest_size=8).digest(), "little", signed=True)
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: bytes, hashvalues) -> None:
+        self.conn.execute("INSERT OR IGNORE INTO docs (key) VALUES (?)", (key,))
+        self.conn.executemany("INSERT OR IGNORE INTO bands (bucket, key) VALUES (?, ?)",
+                              ((bucket, key) for bucket in self.buckets(hashvalues)))
+
+    def neighbours(self, key: bytes) -> Set[bytes]:
+        """Keys sharing at least one band bucket with `key`."""
+        return {k for (k,) in self.conn.execute(
+            "SELECT DISTINCT b2.key FROM bands b1 JOIN bands b2 ON b2.bucket = b1.bucket "
+            "WHERE b1.key = ? AND b2.key != b1.key", (key,))}
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+# Max differing bits for two 64-bit SimHashes to count as near-duplicates.
+# Split into SIMHASH_BANDS bands, any such pair agrees exactly on at least
+# one band (pigeonhole), so only emails sharing a band value are compared.
+SIMHASH_MAX_DISTANCE = 3
+SIMHASH_BANDS = 4
+
+# Body bytes per SimHash block; bounds the NumPy arrays held at once
+SIMHASH_BLOCK_BYTES = 2 * 1024 * 1024
+
+# Bytes that make up words: ASCII letters, digits, "_" and all of UTF-8's
+# multi-byte sequences
+_WORD_BYTES = bytes(range(48, 58)) + bytes(range(65, 91)) + b"_" + bytes(range(97, 123)) + bytes(range(128, 256))
+
+
+def _mix64(x: Any) -> Any:
+    """SplitMix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    import numpy as np
+
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_words(block: List[bytes]) -> Tuple[Any, Any, Any]:
+    """
+    Hash every word of a block of UTF-8 bodies at once in NumPy.
+
+    Words are runs of _WORD_BYTES. Each byte is multiplied by a key for its
+    position in the word and the products are XORed per word, so there is
+    no per-word Python work and hashes are stable across runs.
 
-    seen_hashes: Set[str] = set()
-    kept: List[Dict[str, Any]] = []
-    stats = {"exact_dupes": 0, "near_dupes": 0}
+    Returns:
+        Tuple of (uint64 word hashes, body index of each word, byte length
+        of each word), in text order
+    """
+    import numpy as np
+
+    is_word = np.zeros(256, dtype=bool)
+    is_word[np.frombuffer(_WORD_BYTES, dtype=np.uint8)] = True
+    position_keys = _mix64(np.arange(1, 65, dtype=np.uint64))
+
+    data = np.frombuffer(b"\0".join(block), dtype=np.uint8)
+    lengths = np.fromiter(map(len, block), dtype=np.int64, count=len(block))
+    body_starts = np.cumsum(lengths + 1) - (lengths + 1)
+
+    at = np.flatnonzero(is_word[data])
+    new_word = np.ones(len(at), dtype=bool)
+    new_word[1:] = at[1:] != at[:-1] + 1
+    word_starts = np.flatnonzero(new_word)
+    word_lengths = np.diff(np.append(word_starts, len(at)))
+    if not len(at):
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64), word_lengths
+    position = np.arange(len(at)) - np.repeat(word_starts, word_lengths)
+    mixed = position_keys[position & 63] * (data[at].astype(np.uint64) + np.uint64(1))
+    words = _mix64(np.bitwise_xor.reduceat(mixed, word_starts))
+    body_of = np.searchsorted(body_starts, at[word_starts], side="right") - 1
+    return words, body_of, word_lengths
+
+
+def _byte_blocks(bodies: List[str], max_bytes: int) -> Iterator[Tuple[int, List[bytes]]]:
+    """UTF-8 encoded bodies in blocks of about max_bytes, with each block's first index."""
+    first, block, size = 0, [], 0
+    for i, body in enumerate(bodies):
+        block.append(body.encode("utf8", "surrogatepass"))
+        size += len(block[-1])
+        if size >= max_bytes:
+            yield first, block
+            first, block, size = i + 1, [], 0
+    if block:
+        yield first, block
+
+
+def simhash_signatures(bodies: List[str]) -> Any:
+    """
+    64-bit SimHashes of normalized bodies, as a NumPy uint64 array.
 
-    # Initialize LSH if available
-    lsh = None
-    if has_datasketch:
-        lsh = MinHashLSH(threshold=threshold, num_perm=128)
+    Features are 3-word shingles, where words are runs of letters, digits
+    and non-ASCII characters, so punctuation and spacing edits don't count.
+    A block of bodies is tokenized and hashed as one UTF-8 byte array in
+    NumPy with no per-word Python work; values are stable across runs. A
+    body with no words gets 0.
+    """
+    import numpy as np
 
-    for email in sorted_candidates:
-        body = (email.get("Body") or "").strip().lower()
-        body_normalized = re.sub(r'\s+', ' ', body)  # Normalize whitespace
+    low_bits = np.uint64(0x0101010101010101)
+    rotl = lambda x, r: (x << np.uint64(r)) | (x >> np.uint64(64 - r))
+    signatures = np.zeros(len(bodies), dtype=np.uint64)
 
-        # Level 1: Exact hash match
-        body_hash = hashlib.sha256(body_normalized.encode()).hexdigest()
-        if body_hash in seen_hashes:
-            stats["exact_dupes"] += 1
+    for first, block in _byte_blocks(bodies, SIMHASH_BLOCK_BYTES):
+        words, body_of, _ = hash_words(block)
+        if not len(words):
             continue
-        seen_hashes.add(body_hash)
-
-        # Level 2: MinHash LSH for near-duplicates
-        if lsh is not None and len(body_normalized) > 50:
-            mh = MinHash(num_perm=128)
-            words = body_normalized.split()
-            # Use 3-word shingles
-            for i in range(max(1, len(words) - 2)):
-                shingle = ' '.join(words[i:i+3])
-                mh.update(shingle.encode('utf8'))
-
-            # Check for near-duplicates
-            if lsh.query(mh):
-                stats["near_dupes"] += 1
+
+        # Shingles: lay each body's words out followed by two 0 pads, so a
+        # body of n words has max(1, n - 2) shingles within itself
+        counts = np.bincount(body_of, minlength=len(block))
+        padded = np.zeros(len(words) + 2 * len(block), dtype=np.uint64)
+        padded[np.arange(len(words)) + 2 * body_of] = words
+        present = np.flatnonzero(counts)
+        per_body = np.maximum(1, counts[present] - 2)
+        offsets = np.cumsum(per_body) - per_body
+        padded_starts = (np.cumsum(counts + 2) - (counts + 2))[present]
+        at = np.repeat(padded_starts - offsets, per_body) + np.arange(per_body.sum())
+        features = _mix64(padded[at] ^ rotl(padded[at + 1], 21) ^ rotl(padded[at + 2], 42))
+
+        # Majority vote per bit. Bit k of every byte is counted at once in
+        # the byte lanes of a uint64 sum (shift by k, mask the low bit of
+        # each byte), over runs of at most 255 shingles so lanes can't carry
+        runs = (per_body + 254) // 255
+        run_offsets = np.cumsum(runs) - runs
+        run_starts = np.repeat(offsets, runs) + 255 * (np.arange(runs.sum()) - np.repeat(run_offsets, runs))
+        lanes = np.empty((8, len(run_starts)), dtype="<u8")
+        for k in range(8):
+            lanes[k] = np.add.reduceat((features >> np.uint64(k)) & low_bits, run_starts)
+        # lanes[k] byte j counts bit 8j + k
+        run_ones = lanes.view(np.uint8).reshape(8, len(run_starts), 8).transpose(1, 2, 0).reshape(-1, 64)
+        ones = np.add.reduceat(run_ones, run_offsets, axis=0, dtype=np.int32)
+        majority = (2 * ones > per_body[:, None]).astype(np.uint8)
+        packed = np.packbits(majority, axis=1, bitorder="little")
+        signatures[first + present] = packed.view("<u8").ravel()
+    return signatures
+
+
+_POPCOUNT_TABLE = None
+
+
+def popcount64(values: Any) -> Any:
+    """Set bits per element of a uint64 array (np.bitwise_count on NumPy 2)."""
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    global _POPCOUNT_TABLE
+    if _POPCOUNT_TABLE is None:
+        _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    return _POPCOUNT_TABLE[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1)
+
+
+def simhash_pairs(signatures: Any, max_distance: int = SIMHASH_MAX_DISTANCE) -> List[Tuple[int, int]]:
+    """
+    Index pairs (i < j) whose SimHashes differ in at most max_distance bits.
+
+    For each band (16 bits of 64) the signatures are sorted by its value; walking
+    the offset d = 1, 2, ... between sorted positions while any run of equal
+    values is still longer than d visits every same-bucket pair once per
+    band, and XOR + popcount checks them all as array operations.
+    max_distance must be below SIMHASH_BANDS for the banding to find every
+    pair.
+    """
+    import numpy as np
+
+    band_bits = 64 // SIMHASH_BANDS
+    mask = np.uint64((1 << band_bits) - 1)
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(SIMHASH_BANDS):
+        values = (signatures >> np.uint64(band * band_bits)) & mask
+        order = np.argsort(values, kind="stable")
+        ranked = values[order]
+        active = np.arange(len(order) - 1)
+        d = 1
+        while len(active):
+            active = active[ranked[active] == ranked[active + d]]
+            if not len(active):
+                break
+            left, right = order[active], order[active + d]
+            close = popcount64(signatures[left] ^ signatures[right]) <= max_distance
+            for i, j in zip(left[close].tolist(), right[close].tolist()):
+                pairs.add((i, j) if i < j else (j, i))
+            d += 1
+            active = active[active + d < len(order)]
+    return sorted(pairs)
+
+
+def duplicate_clusters_path(output_path: str) -> str:
+    """Where curation reports duplicate clusters for a shortlist CSV."""
+    return os.path.splitext(output_path)[0] + "_duplicates.csv"
+
+
+class ShortlistSelector:
+    """
+    Streaming top-`per_topic` selection per topic, deduplicated against the
+    selection itself.
+
+    Each topic keeps a min-heap of its best (richness, input order) picks,
+    so memory is O(topics x per_topic) however large the input. With dedupe
+    on, each heap also holds `reserve` (default: per_topic) runners-up: a
+    richer duplicate arriving under another topic can take a pick away,
+    and the best runner-up then fills the slot, as the full sort-then-dedupe
+    would. A topic only ends up short if it loses more than `reserve` picks
+    that way. An email that can't beat a full topic's weakest entry is
+    dropped before any hashing. The rest are checked against the emails
+    currently held, in three levels:
+    1. Exact hash match (SHA-256 of normalized body)
+    2. MinHash LSH for near-duplicates (Jaccard similarity of 3-word shingles)
+    3. SimHash for templated emails with small edits and short notes
+       (Hamming distance of shingle SimHashes, any body length), if asked
+    A duplicate of a richer pick is dropped, and a richer duplicate takes
+    the place of the picks it duplicates. Matching only against picks means
+    clusters never chain through removed emails.
+
+    Only a short record (Message-ID, subject, length) of each removed
+    duplicate is kept, for the duplicate cluster report. With other_topics,
+    emails labelled "other" are split into its fitted topics.
+    """
+
+    def __init__(
+        self,
+        per_topic: int = 200,
+        dedupe: bool = True,
+        threshold: float = 0.8,
+        simhash: bool = False,
+        workers: int = 1,
+        index_path: Optional[str] = None,
+        quiet: bool = False,
+        other_topics: Optional["OtherTopicModel"] = None,
+        reserve: Optional[int] = None
+    ):
+        self.per_topic = per_topic
+        # Heap bound per topic; only the top per_topic are returned
+        self.capacity = per_topic + ((per_topic if reserve is None else reserve) if dedupe else 0)
+        self.dedupe = dedupe
+        self.simhash = simhash
+        self.workers = workers
+        self.other_topics = other_topics
+        self.heaps: Dict[str, List[Tuple[int, int]]] = {}
+        self.picks: Dict[int, Tuple[str, int, Dict[str, Any], Optional[bytes]]] = {}
+        self.totals: Dict[str, int] = {}
+        self.seq = 0
+        self.stats = {"exact_dupes": 0, "near_dupes": 0, "simhash_dupes": 0, "hashed": 0}
+
+        self.by_hash: Dict[bytes, int] = {}
+        # Picked SimHashes, compact: slot -> signature and slot -> pick (0 = free)
+        self.simhash_values = self.simhash_owners = None
+        self.simhash_slots: Dict[int, int] = {}
+        self.free_slots: List[int] = []
+        self.summaries: Dict[int, Tuple[str, str, int]] = {}
+        self.clusters: Dict[int, List[Tuple[int, str]]] = {}
+
+        self.index = None
+        if dedupe:
+            try:
+                from datasketch import MinHash, MinHashLSH
+                layout = MinHashLSH(threshold=threshold, num_perm=MINHASH_NUM_PERM)
+                template = MinHash(num_perm=MINHASH_NUM_PERM)
+                scheme = f"{getattr(template, 'scheme', 'legacy')}/{template.hashvalues.dtype}"
+                self.index = DedupeIndex(index_path or ":memory:", layout.b, layout.r, scheme)
+            except ImportError:
+                if not quiet:
+                    print("Warning: datasketch not installed, using exact-match only")
+            if simhash:
+                try:
+                    import numpy as np
+                    self.simhash_values = np.zeros(0, np.uint64)
+                    self.simhash_owners = np.zeros(0, np.int64)
+                except ImportError:
+                    self.simhash = False
+                    if not quiet:
+                        print("Warning: numpy not installed, skipping SimHash near-duplicates")
+
+    def _outranked(self, topic: str, rank: Tuple[int, int]) -> bool:
+        """True if `topic` is full and its weakest pick ranks at least `rank`."""
+        heap = self.heaps.get(topic)
+        return heap is not None and len(heap) >= self.capacity and heap[0] >= rank
+
+    def _unpick(self, seq: int) -> None:
+        """Remove a pick (already off its heap) from the dedupe lookups."""
+        _, _, _, key = self.picks.pop(seq)
+        if key is not None and self.by_hash.get(key) == seq:
+            del self.by_hash[key]
+        slot = self.simhash_slots.pop(seq, None)
+        if slot is not None:
+            self.simhash_owners[slot] = 0
+            self.free_slots.append(slot)
+
+    def _store_simhash(self, seq: int, signature: Any) -> None:
+        import numpy as np
+
+        if not self.free_slots:
+            size = len(self.simhash_values)
+            grown = max(1024, 2 * size)
+            values, owners = np.zeros(grown, np.uint64), np.zeros(grown, np.int64)
+            values[:size], owners[:size] = self.simhash_values, self.simhash_owners
+            self.simhash_values, self.simhash_owners = values, owners
+            self.free_slots = list(range(grown - 1, size - 1, -1))
+        slot = self.free_slots.pop()
+        self.simhash_values[slot] = signature
+        self.simhash_owners[slot] = seq
+        self.simhash_slots[seq] = slot
+
+    def _simhash_neighbours(self, prepared: List[Tuple[Any, ...]]) -> Tuple[Dict[int, Any], Dict[int, List[int]]]:
+        """
+        SimHash a chunk and find, per email, the picks and chunk emails
+        within SIMHASH_MAX_DISTANCE bits, in one banded search over the
+        picked signatures and the chunk's.
+
+        Returns:
+            Tuple of ({index: signature}, {index: [seq, ...]}), indexes
+            being positions in `prepared`
+        """
+        import numpy as np
+
+        worded = [i for i, item in enumerate(prepared) if re.search(r"\w", item[5])]
+        if not worded:
+            return {}, {}
+        block = simhash_signatures([prepared[i][5] for i in worded])
+        live = np.flatnonzero(self.simhash_owners)
+        owners = self.simhash_owners[live].tolist()
+        combined = np.concatenate([self.simhash_values[live], block])
+
+        neighbours: Dict[int, List[int]] = {}
+        for a, b in simhash_pairs(combined):
+            if b < len(owners):
+                continue
+            j = worded[b - len(owners)]
+            if a < len(owners):
+                neighbours.setdefault(j, []).append(owners[a])
+            else:
+                i = worded[a - len(owners)]
+                neighbours.setdefault(j, []).append(prepared[i][1])
+                neighbours.setdefault(i, []).append(prepared[j][1])
+        return dict(zip(worded, block)), neighbours
+
+    def _duplicates(self, key: bytes, body_normalized: str, near: Optional[List[int]]) -> Tuple[List[int], str]:
+        """Picks that an email duplicates, with the level that matched."""
+        if key in self.by_hash:
+            return [self.by_hash[key]], "exact"
+        if self.index is not None and len(body_normalized) > 50:
+            matches = [self.by_hash[k] for k in self.index.neighbours(key) if k in self.by_hash]
+            if matches:
+                return matches, "minhash"
+        if near:
+            matches = sorted(seq for seq in near if seq in self.picks)
+            if matches:
+                return matches, "simhash"
+        return [], ""
+
+    def _prepare(self, chunk: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """Label and rank a chunk, keeping emails that could still be picked."""
+        prepared = []
+        topics = [label_topic(email.get("Subject", ""), email.get("Body") or "") for email in chunk]
+        if self.other_topics is not None:
+            others = [i for i, topic in enumerate(topics) if topic == "other"]
+            for i, topic in zip(others, self.other_topics.assign([chunk[i].get("Body") or "" for i in others])):
+                topics[i] = topic
+        for email, topic in zip(chunk, topics):
+            body = email.get("Body") or ""
+            richness = richness_score(body)
+            self.totals[topic] = self.totals.get(topic, 0) + 1
+            self.seq += 1
+            if self._outranked(topic, (richness, -self.seq)):
                 continue
+            key = body_normalized = None
+            if self.dedupe:
+                body_normalized = re.sub(r'\s+', ' ', body.strip().lower())  # Normalize whitespace
+                key = hashlib.sha256(body_normalized.encode()).digest()
+            prepared.append((richness, self.seq, topic, email, key, body_normalized))
+        return prepared
+
+    def add(self, emails: Iterable[Dict[str, Any]]) -> None:
+        """
+        Offer a stream of style candidates.
+
+        Emails are taken DEDUPE_CHUNK_DOCS at a time; MinHash signatures of
+        a chunk's contenders the index hasn't seen are computed in worker
+        processes (if asked) while earlier chunks are selected from.
+        """
+        from collections import deque
+
+        # Chunks wait here, in order, while their signatures are computed
+        pending = deque()
+
+        def tasks() -> Iterator[List[str]]:
+            stream = iter(emails)
+            for chunk in iter(lambda: list(itertools.islice(stream, DEDUPE_CHUNK_DOCS)), []):
+                prepared = self._prepare(chunk)
+                new_docs: Dict[bytes, str] = {}
+                if self.index is not None:
+                    long_docs = [(key, body) for _, _, _, _, key, body in prepared if len(body) > 50]
+                    known = self.index.known([key for key, _ in long_docs])
+                    new_docs = {key: body for key, body in long_docs if key not in known}
+                pending.append((prepared, list(new_docs)))
+                yield list(new_docs.values())
+
+        if self.index is None:
+            signature_chunks = ([] for _ in tasks())
+        elif self.workers > 1:
+            signature_chunks = _ordered_pool_map(minhash_signatures, tasks(), self.workers)
+        else:
+            signature_chunks = map(minhash_signatures, tasks())
+
+        for signatures in signature_chunks:
+            prepared, new_keys = pending.popleft()
+            if self.index is not None:
+                for key, hashvalues in zip(new_keys, signatures):
+                    self.index.add(key, hashvalues)
+                self.stats["hashed"] += len(new_keys)
+                self.index.commit()
+            self._select(prepared)
+
+    def _select(self, prepared: List[Tuple[Any, ...]]) -> None:
+        signatures: Dict[int, Any] = {}
+        neighbours: Dict[int, List[int]] = {}
+        if self.dedupe and self.simhash and prepared:
+            signatures, neighbours = self._simhash_neighbours(prepared)
+
+        # Richest first, so a chunk's own duplicates keep their richest copy
+        for i in sorted(range(len(prepared)), key=lambda i: (-prepared[i][0], prepared[i][1])):
+            richness, seq, topic, email, key, body_normalized = prepared[i]
+            rank = (richness, -seq)
+            if self._outranked(topic, rank):
+                continue
+            self.summaries[seq] = (email.get("Message-ID") or "", (email.get("Subject") or "").replace("\n", " "),
+                                   len(email.get("Body") or ""))
+            if self.dedupe:
+                matches, method = self._duplicates(key, body_normalized, neighbours.get(i))
+                if matches:
+                    best = max(matches, key=lambda m: (self.picks[m][1], -m))
+                    if (self.picks[best][1], -best) >= rank:
+                        self._add_duplicate(best, seq, method)
+                        continue
+                    for m in matches:
+                        heap = self.heaps[self.picks[m][0]]
+                        heap.remove((self.picks[m][1], -m))
+                        heapq.heapify(heap)
+                        self._unpick(m)
+                        self._add_duplicate(seq, m, method)
+
+            heap = self.heaps.setdefault(topic, [])
+            if len(heap) >= self.capacity:
+                _, weakest = heapq.heappop(heap)
+                self._unpick(-weakest)
+                if -weakest not in self.clusters:
+                    del self.summaries[-weakest]
+            heapq.heappush(heap, rank)
+            self.picks[seq] = (topic, richness, email, key)
+            if key is not None:
+                self.by_hash[key] = seq
+            if i in signatures:
+                self._store_simhash(seq, signatures[i])
+
+    def _add_duplicate(self, kept: int, removed: int, method: str) -> None:
+        self.stats[{"exact": "exact_dupes", "minhash": "near_dupes", "simhash": "simhash_dupes"}[method]] += 1
+        cluster = self.clusters.setdefault(kept, [])
+        cluster.append((removed, method))
+        cluster.extend(self.clusters.pop(removed, ()))
+
+    def results(self) -> Tuple[List[Tuple[str, List[Tuple[int, Dict[str, Any]]]]], Optional[Dict[str, Any]]]:
+        """
+        The picks, by topic (largest first) then richness, and dedupe stats.
+
+        Returns:
+            Tuple of ([(topic, [(richness, email), ...]), ...], stats_dict),
+            stats_dict being None when dedupe is off
+        """
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        by_topic = []
+        for topic in sorted(self.totals, key=lambda t: self.totals[t], reverse=True):
+            ranked = sorted(self.heaps.get(topic, []), reverse=True)[:self.per_topic]
+            by_topic.append((topic, [(richness, self.picks[-neg_seq][2]) for richness, neg_seq in ranked]))
+        if not self.dedupe:
+            return by_topic, None
+        stats = dict(self.stats)
+        stats["removed"] = stats["exact_dupes"] + stats["near_dupes"] + stats["simhash_dupes"]
+        stats["clusters"] = len(self.clusters)
+        stats["largest_cluster"] = max((len(c) + 1 for c in self.clusters.values()), default=0)
+        return by_topic, stats
+
+    def write_clusters(self, path: str) -> None:
+        """
+        Write duplicate clusters as CSV, one row per email.
+
+        Each cluster lists the kept (richest) email first, then its removed
+        duplicates with the level that caught them: exact, minhash or simhash.
+        """
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["cluster", "role", "method", "message_id", "subject", "body_length"])
+            for cluster_id, kept in enumerate(sorted(self.clusters)):
+                rows = [(kept, "kept", "")] + [(seq, "duplicate", method) for seq, method in self.clusters[kept]]
+                for seq, role, method in rows:
+                    message_id, subject, length = self.summaries[seq]
+                    writer.writerow([cluster_id, role, method, message_id, subject, length])
+
+
+# "Other" topic clustering: hashed TF-IDF vectors of a reservoir sample of
+# "other" emails, split by spherical mini-batch k-means
+OTHER_CLUSTER_FEATURES = 1 << 18
+OTHER_CLUSTER_SAMPLE = 20000
+OTHER_CLUSTER_BATCH = 1024
+OTHER_CLUSTER_STEPS = 100
+
+# Words too common (or too templated, like PII placeholders) to tell topics apart
+TFIDF_STOPWORDS = """
+about after again also and any are back been before being but can could did does doing done for from get
+going had has have her here him his how into its just know let like make more most much not now off one only
+other our out over please really said see should some than thank thanks that the their them then there these
+they this those through too under until very want was way well were what when where which while who why will
+with would yes you your yours person email phone location url
+""".split()
+
+
+def tfidf_term_counts(bodies: List[str]) -> Any:
+    """
+    Term counts of bodies as a SciPy CSR matrix over hashed features.
+
+    Words (see hash_words) of three or more bytes, lowercased and minus
+    TFIDF_STOPWORDS, are hashed into OTHER_CLUSTER_FEATURES columns; no
+    vocabulary is kept, so memory doesn't grow with the corpus.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    stop_hashes, _, _ = hash_words([w.encode("utf8") for w in TFIDF_STOPWORDS])
+    rows, cols = [], []
+    for first, block in _byte_blocks([b.lower() for b in bodies], SIMHASH_BLOCK_BYTES):
+        words, body_of, lengths = hash_words(block)
+        keep = (lengths >= 3) & ~np.isin(words, stop_hashes)
+        rows.append(body_of[keep] + first)
+        cols.append((words[keep] % np.uint64(OTHER_CLUSTER_FEATURES)).astype(np.int64))
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+    counts = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                               shape=(len(bodies), OTHER_CLUSTER_FEATURES))
+    counts.sum_duplicates()
+    return counts
+
+
+class OtherTopicModel:
+    """
+    Data-driven topics for emails no keyword topic matched.
+
+    Holds the IDF weights and unit-length k-means centroids fitted by
+    fit_other_topics, and names each topic "other/<top>-<terms>".
+    """
+
+    def __init__(self, idf: Any, centroids: Any, names: List[str], sample_size: int):
+        self.idf = idf
+        self.centroids = centroids
+        self.names = names
+        self.sample_size = sample_size
+
+    def vectorize(self, bodies: List[str]) -> Any:
+        """L2-normalized TF-IDF rows (sublinear TF) for bodies."""
+        import numpy as np
+        from scipy import sparse
+
+        matrix = tfidf_term_counts(bodies)
+        matrix.data = (1 + np.log(matrix.data)) * self.idf[matrix.indices]
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms).dot(matrix).tocsr()
+
+    def assign(self, bodies: List[str]) -> List[str]:
+        """A topic name per body; "other" for bodies with no usable words."""
+        import numpy as np
+
+        if not bodies:
+            return []
+        vectors = self.vectorize(bodies)
+        nearest = np.asarray(vectors.dot(self.centroids.T)).argmax(axis=1)
+        empty = np.diff(vectors.indptr) == 0
+        return ["other" if blank else self.names[j] for j, blank in zip(nearest.tolist(), empty.tolist())]
+
+
+def fit_other_topics(bodies: List[str], clusters: int, seed: int = 0) -> Optional[OtherTopicModel]:
+    """
+    Fit `clusters` topics to a sample of "other" bodies.
 
-            # Insert into LSH index
-            email_id = email.get("Message-ID") or str(len(kept))
-            lsh.insert(email_id, mh)
+    IDF comes from the sample. Centroids start from k-means++ picks and are
+    refined by spherical mini-batch k-means (Sculley 2010): each step
+    assigns OTHER_CLUSTER_BATCH sampled rows by cosine similarity and moves
+    each centroid towards its rows' mean at a rate that decays with the
+    rows it has absorbed. Memory is the sample plus clusters x
+    OTHER_CLUSTER_FEATURES floats, independent of corpus size.
 
-        kept.append(email)
+    Returns:
+        OtherTopicModel, or None when the sample is too small to split
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    counts = tfidf_term_counts(bodies)
+    df = np.bincount(counts.indices, minlength=OTHER_CLUSTER_FEATURES)
+    idf = (np.log((1 + len(bodies)) / (1 + df)) + 1).astype(np.float32)
+    model = OtherTopicModel(idf, None, [], len(bodies))
+    vectors = model.vectorize(bodies)
+    vectors = vectors[np.flatnonzero(np.diff(vectors.indptr))]
+    clusters = min(clusters, vectors.shape[0])
+    if clusters < 2:
+        return None
 
-    stats["kept"] = len(kept)
-    stats["removed"] = len(candidates) - len(kept)
+    # k-means++ seeding on cosine distance
+    centroids = np.zeros((clusters, OTHER_CLUSTER_FEATURES), dtype=np.float32)
+    centroids[0] = vectors[rng.integers(vectors.shape[0])].toarray()
+    closest = np.asarray(vectors.dot(centroids[0])).ravel()
+    for j in range(1, clusters):
+        weights = np.maximum(1 - closest, 0) ** 2
+        pick = rng.choice(vectors.shape[0], p=weights / weights.sum()) if weights.sum() > 0 else rng.integers(vectors.shape[0])
+        centroids[j] = vectors[pick].toarray()
+        closest = np.maximum(closest, np.asarray(vectors.dot(centroids[j])).ravel())
+
+    absorbed = np.zeros(clusters)
+    for _ in range(OTHER_CLUSTER_STEPS):
+        batch = vectors[rng.integers(vectors.shape[0], size=min(OTHER_CLUSTER_BATCH, vectors.shape[0]))]
+        nearest = np.asarray(batch.dot(centroids.T)).argmax(axis=1)
+        for j in np.unique(nearest):
+            rows = batch[nearest == j]
+            absorbed[j] += rows.shape[0]
+            rate = rows.shape[0] / absorbed[j]
+            centroids[j] = (1 - rate) * centroids[j] + rate * np.asarray(rows.mean(axis=0)).ravel()
+            norm = np.linalg.norm(centroids[j])
+            if norm:
+                centroids[j] /= norm
+
+    model.centroids = centroids
+    model.names = _name_other_topics(bodies, centroids)
+    return model
+
+
+def _name_other_topics(bodies: List[str], centroids: Any, terms: int = 2) -> List[str]:
+    """Name each centroid after the commonest sample word in its heaviest features."""
+    import numpy as np
+    from collections import Counter
+
+    vocabulary = Counter(w for w in re.findall(r"\w{3,}", " ".join(bodies).lower()) if w not in TFIDF_STOPWORDS)
+    words = [w for w, _ in vocabulary.most_common()]
+    # Each \w run is a single hash_words word, so hashes line up with words
+    hashes, _, _ = hash_words([w.encode("utf8") for w in words])
+    feature_word: Dict[int, str] = {}
+    for word, feature in zip(words, (hashes % np.uint64(OTHER_CLUSTER_FEATURES)).tolist()):
+        feature_word.setdefault(feature, word)  # commonest word wins a shared feature
+
+    names: List[str] = []
+    for j, centroid in enumerate(centroids):
+        top = [feature_word[f] for f in np.argsort(centroid)[::-1][:terms * 4].tolist() if f in feature_word][:terms]
+        name = "other/" + ("-".join(top) if top else str(j + 1))
+        names.append(name if name not in names else f"{name}-{j + 1}")
+    return names
+
+
+def sample_other_bodies(
+    emails: Iterable[Dict[str, Any]],
+    min_chars: int = 200,
+    size: int = OTHER_CLUSTER_SAMPLE,
+    seed: int = 0
+) -> Tuple[List[str], int]:
+    """
+    Reservoir sample (Algorithm R) of style candidates labelled "other".
 
-    if not quiet:
-        print(f"      🗑️  Removed {stats['exact_dupes']:,} exact + {stats['near_dupes']:,} near-duplicates")
+    Returns:
+        Tuple of (sampled bodies, number of "other" candidates seen)
+    """
+    import random
 
-    return kept, stats
+    rng = random.Random(seed)
+    sample: List[str] = []
+    seen = 0
+    for e in emails:
+        if not is_style_candidate(e, min_chars) or label_topic(e.get("Subject", ""), e.get("Body", "")) != "other":
+            continue
+        seen += 1
+        if len(sample) < size:
+            sample.append(e.get("Body") or "")
+        else:
+            j = rng.randrange(seen)
+            if j < size:
+                sample[j] = e.get("Body") or ""
+    return sample, seen
 
 
 def build_shortlist(
@@ -960,69 +3606,143 @@ def build_shortlist(
     min_chars: int = 200,
     dedupe: bool = True,
     dedupe_threshold: float = 0.8,
-    quiet: bool = False
+    quiet: bool = False,
+    workers: int = 1,
+    keep_dedupe_index: bool = True,
+    simhash: bool = False,
+    cluster_other: int = 0
 ) -> Dict[str, Any]:
     """
     Build a curated shortlist of high-quality style samples.
 
     Args:
-        input_path: Path to cleaned emails JSON
+        input_path: Path to cleaned emails (JSONL, .jsonl.gz or JSON array)
         output_path: Path to output CSV
         per_topic: Max emails per topic bucket
         min_chars: Minimum body length
         dedupe: If True, remove duplicate and near-duplicate emails
         dedupe_threshold: Jaccard similarity threshold for near-duplicates
         quiet: If True, suppress progress output
+        workers: Number of processes computing MinHash signatures
+        keep_dedupe_index: If True, keep near-duplicate signatures in
+            dedupe_index.sqlite3 next to the output, so later runs only hash
+            emails they haven't seen
+        simhash: If True, also drop SimHash near-duplicates (templated
+            emails and short notes the MinHash level misses); off by
+            default, since it changes which emails are picked
+        cluster_other: If 2 or more, first pass over the input to split the
+            "other" topic into this many TF-IDF k-means clusters (0 = off)
 
     Returns:
         Statistics dict
     """
-    with open(input_path, "r", encoding="utf-8") as f:
-        emails = json.load(f)
+    other_topics = None
+    other_stats = None
+    if cluster_other > 1:
+        try:
+            import numpy  # noqa: F401
+            import scipy.sparse  # noqa: F401
+        except ImportError:
+            print("Error: scipy not installed (needed to cluster the \"other\" topic). Run: pip install scipy")
+            sys.exit(1)
+        if not quiet:
+            print(f"   🧩 Sampling \"other\" emails from {os.path.basename(input_path)}...")
+        sample, seen = sample_other_bodies(iter_records(input_path), min_chars)
+        other_topics = fit_other_topics(sample, cluster_other)
+        other_stats = {"other_emails": seen, "sample": len(sample),
+                       "clusters": other_topics.names if other_topics else []}
+        if not quiet:
+            if other_topics:
+                print(f"      ✓ Split {seen:,} \"other\" emails into {len(other_topics.names)} topics "
+                      f"(fitted on {len(sample):,})")
+            else:
+                print(f"      Too few \"other\" emails to cluster ({seen:,})")
 
     if not quiet:
-        print(f"   📂 Loaded {len(emails):,} cleaned emails")
+        print(f"   📂 Reading: {os.path.basename(input_path)}")
 
-    # Filter candidates
-    candidates = [e for e in emails if is_style_candidate(e, min_chars)]
-    filtered_out = len(emails) - len(candidates)
-    if not quiet:
-        print(f"   🔍 Quality filter: {len(candidates):,} candidates ({filtered_out:,} too short/boring)")
+    dedupe_index = None
+    if keep_dedupe_index:
+        dedupe_index = os.path.join(os.path.dirname(os.path.abspath(output_path)), DEDUPE_INDEX_FILENAME)
+    stats = curate_records(iter_records(input_path), output_path, per_topic, min_chars, dedupe, dedupe_threshold, quiet,
+                           workers, dedupe_index, simhash, other_topics)
+    if other_stats:
+        stats["other_clustering"] = other_stats
+    write_stage_manifest("curate", input_path, output_path,
+                         curate_params(per_topic, min_chars, dedupe, dedupe_threshold, simhash, cluster_other),
+                         stats["shortlisted"])
+    return stats
 
-    # Deduplicate
-    dedupe_stats = None
-    if dedupe:
-        if not quiet:
-            print(f"   🧹 Removing duplicates...")
-        candidates, dedupe_stats = deduplicate_emails(candidates, dedupe_threshold, quiet)
-        if not quiet:
-            print(f"      ✓ {len(candidates):,} unique emails remain")
 
-    # Bucket by topic
+def curate_records(
+    emails: Iterable[Dict[str, Any]],
+    output_path: str = "style_shortlist.csv",
+    per_topic: int = 200,
+    min_chars: int = 200,
+    dedupe: bool = True,
+    dedupe_threshold: float = 0.8,
+    quiet: bool = False,
+    workers: int = 1,
+    dedupe_index: Optional[str] = None,
+    simhash: bool = False,
+    other_topics: Optional[OtherTopicModel] = None
+) -> Dict[str, Any]:
+    """
+    Build the shortlist CSV from a stream of cleaned emails.
+
+    Candidates are selected as they stream past (see ShortlistSelector), so
+    only the current top per_topic of each topic is held in memory; see
+    build_shortlist for the meaning of the arguments. dedupe_index is the
+    SQLite file of the near-duplicate index (None = keep it in memory for
+    this run). Duplicate clusters are written next to the shortlist (see
+    duplicate_clusters_path). other_topics (from fit_other_topics) splits
+    the "other" topic.
+    """
+    counts = {"total": 0, "candidates": 0}
+
+    def style_candidates() -> Iterator[Dict[str, Any]]:
+        for e in emails:
+            counts["total"] += 1
+            if is_style_candidate(e, min_chars):
+                counts["candidates"] += 1
+                yield e
+
+    if not quiet:
+        print(f"   🏷️  Selecting the top {per_topic:,} emails per topic{' (deduplicated)' if dedupe else ''}...")
+    selector = ShortlistSelector(per_topic, dedupe, dedupe_threshold, simhash, workers, dedupe_index, quiet,
+                                 other_topics)
+    selector.add(style_candidates())
+    by_topic, dedupe_stats = selector.results()
+
+    filtered_out = counts["total"] - counts["candidates"]
     if not quiet:
-        print(f"   🏷️  Categorizing by topic...")
-    buckets: Dict[str, List[Dict[str, Any]]] = {}
-    for e in candidates:
-        topic = label_topic(e.get("Subject", ""), e.get("Body", ""))
-        e["_topic"] = topic
-        e["_richness"] = richness_score(e.get("Body", ""))
-        buckets.setdefault(topic, []).append(e)
-
-    # Select top N per topic
+        print(f"   🔍 Quality filter: {counts['candidates']:,} candidates ({filtered_out:,} too short/boring)")
+    if dedupe_stats:
+        selector.write_clusters(duplicate_clusters_path(output_path))
+        if not quiet:
+            print(f"   🧹 Removed {dedupe_stats['exact_dupes']:,} exact + {dedupe_stats['near_dupes']:,} near + "
+                  f"{dedupe_stats['simhash_dupes']:,} SimHash duplicates")
+            if dedupe_index:
+                print(f"      ♻️  Hashed {dedupe_stats['hashed']:,} new emails "
+                      f"(the rest were already in the dedupe index)")
+            if dedupe_stats["clusters"]:
+                print(f"      🧬 {dedupe_stats['clusters']:,} duplicate clusters "
+                      f"(largest: {dedupe_stats['largest_cluster']:,} emails) → "
+                      f"{os.path.basename(duplicate_clusters_path(output_path))}")
+
+    # Top N per topic
     shortlisted = []
     topic_stats = {}
     topic_emojis = {"client": "👔", "strategy": "🎯", "update": "📝", "feedback": "💬", "workshop": "🛠️", "other": "📋"}
 
     if not quiet:
         print(f"\n   📊 TOPIC BREAKDOWN:")
-    for topic, items in sorted(buckets.items(), key=lambda x: len(x[1]), reverse=True):
-        items_sorted = sorted(items, key=lambda x: x["_richness"], reverse=True)
-        picked = items_sorted[:per_topic]
-        topic_stats[topic] = {"total": len(items), "selected": len(picked)}
+    for topic, picked in by_topic:
+        topic_stats[topic] = {"total": selector.totals[topic], "selected": len(picked)}
         emoji = topic_emojis.get(topic, "📋")
         if not quiet:
-            print(f"      {emoji} {topic}: {len(picked):,} selected (from {len(items):,})")
-        shortlisted.extend(picked)
+            print(f"      {emoji} {topic}: {len(picked):,} selected (from {selector.totals[topic]:,})")
+        shortlisted.extend((topic, richness, e) for richness, e in picked)
 
     # Write CSV
     with open(output_path, "w", encoding="utf-8", newline="") as f:
@@ -1031,7 +3751,7 @@ def build_shortlist(
             "id", "message_id", "subject", "body", "to",
             "topic", "body_length", "paragraph_count", "richness_score"
         ])
-        for idx, e in enumerate(shortlisted):
+        for idx, (topic, richness, e) in enumerate(shortlisted):
             body = e.get("Body") or ""
             writer.writerow([
                 idx,
@@ -1039,10 +3759,10 @@ def build_shortlist(
                 (e.get("Subject") or "").replace("\n", " "),
                 body,
                 e.get("To") or "",
-                e.get("_topic"),
+                topic,
                 len(body),
                 body.count("\n\n"),
-                e.get("_richness"),
+                richness,
             ])
 
     if not quiet:
@@ -1052,21 +3772,251 @@ def build_shortlist(
         print(f"   💾 Saved to: {os.path.basename(output_path)}")
 
     result = {
-        "total_input": len(emails),
-        "candidates": len(candidates),
+        "total_input": counts["total"],
+        "candidates": counts["candidates"],
         "shortlisted": len(shortlisted),
         "topics": topic_stats,
         "output": output_path
     }
     if dedupe_stats:
         result["deduplication"] = dedupe_stats
+        result["duplicates_output"] = duplicate_clusters_path(output_path)
     return result
 
 
+# =============================================================================
+# RESOURCE USAGE
+# =============================================================================
+
+def peak_rss_mb() -> int:
+    """
+    Peak resident memory of this process so far, in MB (0 if unavailable).
+
+    Worker processes are not included; each holds one chunk of records and
+    its own PII engine.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak // (1024 * 1024) if sys.platform == "darwin" else peak // 1024
+
+
+# =============================================================================
+# STAGE MANIFESTS
+# =============================================================================
+
+# Bump when a stage's output format or filtering changes, so outputs written
+# by an older pipeline are rebuilt instead of resumed.
+PIPELINE_VERSION = "5"
+
+# Files larger than this are fingerprinted from head/middle/tail samples
+FINGERPRINT_SAMPLE_BYTES = 4 * 1024 * 1024
+
+
+def fingerprint_file(path: str) -> str:
+    """
+    Content fingerprint of a file: sha256 over its size and bytes.
+
+    Files up to 3 x FINGERPRINT_SAMPLE_BYTES are hashed in full; larger ones
+    hash a sample from the start, middle and end, which still catches
+    truncation, appends and in-place edits without reading gigabytes.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        Hex digest
+    """
+    size = os.path.getsize(path)
+    h = hashlib.sha256(str(size).encode())
+    with open(path, "rb") as f:
+        if size <= 3 * FINGERPRINT_SAMPLE_BYTES:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(block)
+        else:
+            for offset in (0, (size - FINGERPRINT_SAMPLE_BYTES) // 2, size - FINGERPRINT_SAMPLE_BYTES):
+                f.seek(offset)
+                h.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+    return h.hexdigest()
+
+
+def fingerprint_input(input_path: str) -> str:
+    """
+    Content fingerprint of a stage input (file, directory of MBOX files, or zip).
+
+    A split Takeout export is fingerprinted over all of its parts.
+
+    Args:
+        input_path: Path to input
+
+    Returns:
+        Hex digest, or "" if the input does not exist
+    """
+    if os.path.isdir(input_path):
+        files = find_mbox_files(input_path, quiet=True)
+    elif os.path.isfile(input_path) and input_path.lower().endswith(".zip"):
+        files = _zip_parts(input_path)
+    elif os.path.isfile(input_path):
+        return fingerprint_file(input_path)
+    else:
+        return ""
+
+    h = hashlib.sha256()
+    for path in files:
+        h.update(os.path.relpath(path, input_path if os.path.isdir(input_path) else
+                                 os.path.dirname(input_path)).encode())
+        h.update(fingerprint_file(path).encode())
+    return h.hexdigest()
+
+
+def stage_manifest_path(output_path: str) -> str:
+    """Path of the manifest written next to a stage output."""
+    return output_path + ".manifest.json"
+
+
+def write_stage_manifest(
+    stage: str,
+    input_path: str,
+    output_path: str,
+    params: Dict[str, Any],
+    records: int
+) -> None:
+    """
+    Record how a stage output was produced, next to the output.
+
+    Args:
+        stage: Stage name ("import", "convert", "clean", "curate")
+        input_path: Stage input the output was built from
+        output_path: Stage output file
+        params: Parameters that affect the output (must be JSON-serializable)
+        records: Number of records written
+    """
+    manifest = {
+        "stage": stage,
+        "version": PIPELINE_VERSION,
+        "input": fingerprint_input(input_path),
+        "params": params,
+        "records": records,
+        "output_size": os.path.getsize(output_path),
+        "output": fingerprint_file(output_path),
+        "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    _write_json_atomic(stage_manifest_path(output_path), manifest)
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON via a temp file so readers never see a partial file."""
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def load_stage_manifest(output_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a stage manifest if it still describes the output next to it.
+
+    Returns None when the output or manifest is missing, unreadable, written
+    by another pipeline version, or the output was truncated or modified
+    after the manifest was written (e.g. an interrupted run).
+
+    Args:
+        output_path: Stage output file
+
+    Returns:
+        Manifest dict or None
+    """
+    try:
+        with open(stage_manifest_path(output_path), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != PIPELINE_VERSION:
+            return None
+        if os.path.getsize(output_path) != manifest.get("output_size"):
+            return None
+        if fingerprint_file(output_path) != manifest.get("output"):
+            return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    return manifest
+
+
+def check_stage_manifest(
+    stage: str,
+    input_path: str,
+    output_path: str,
+    params: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the manifest of an up-to-date stage output, or None if the stage must run.
+
+    The output is up to date when it is intact and was built by this stage
+    from the same input content with the same parameters.
+
+    Args:
+        stage: Stage name
+        input_path: Stage input
+        output_path: Stage output file
+        params: Parameters the stage would run with now
+
+    Returns:
+        Manifest dict (with the record count) or None
+    """
+    manifest = load_stage_manifest(output_path)
+    if manifest is None or manifest.get("stage") != stage or manifest.get("params") != params:
+        return None
+    if manifest.get("input") != fingerprint_input(input_path):
+        return None
+    return manifest
+
+
+def import_params(sender_email: Optional[str], years: int = 5) -> Dict[str, Any]:
+    """Parameters recorded in the import stage manifest."""
+    return {"sender": sender_email.lower() if sender_email else None, "years": years}
+
+
+def convert_params(strip_fields: bool = True) -> Dict[str, Any]:
+    """Parameters recorded in the convert stage manifest."""
+    return {"strip_fields": strip_fields}
+
+
+def clean_params(sender_email: Optional[str], years: int = 5) -> Dict[str, Any]:
+    """Parameters recorded in the clean stage manifest."""
+    return {"sender": sender_email.lower() if sender_email else None, "years": years,
+            "pii_model": pii_model_fingerprint()}
+
+
+def curate_params(
+    per_topic: int = 200,
+    min_chars: int = 200,
+    dedupe: bool = True,
+    dedupe_threshold: float = 0.8,
+    simhash: bool = False,
+    cluster_other: int = 0
+) -> Dict[str, Any]:
+    """Parameters recorded in the curate stage manifest (with the configured taxonomy)."""
+    params = {"per_topic": per_topic, "min_chars": min_chars, "dedupe": dedupe,
+              "dedupe_threshold": dedupe_threshold, "taxonomy": _taxonomy.fingerprint,
+              "cluster_other": cluster_other}
+    # Only recorded when on, so manifests from before the option still match
+    if simhash:
+        params["simhash"] = True
+    return params
+
+
 # =============================================================================
 # FULL PIPELINE
 # =============================================================================
 
+CLEANED_FILENAME = "cleaned_emails.jsonl"
+
+
+def cleaned_filename(compress: bool = False) -> str:
+    """File name of the clean stage output in a pipeline output directory."""
+    return CLEANED_FILENAME + ".gz" if compress else CLEANED_FILENAME
+
+
 def needs_mbox_import(input_path: str) -> bool:
     """Check if input needs MBOX import (vs already being JSON)."""
     lower = input_path.lower()
@@ -1086,19 +4036,352 @@ def needs_mbox_import(input_path: str) -> bool:
     return True
 
 
+def message_key(rec: Dict[str, Any]) -> str:
+    """
+    Stable identity for a message: its Message-ID, or a content hash of
+    sender, date, subject and body when it has none.
+    """
+    msg_id = normalize_message_id(get_field(rec, "Message-ID", "Message-Id", "MessageId", "message_id"))
+    if msg_id:
+        return msg_id
+    content = [str(get_field(rec, *keys) or "") for keys in (
+        ("From", "from", "Sender", "sender"),
+        ("Date", "date"),
+        ("Subject", "subject"),
+        ("Body", "body", "Text", "text", "Content", "content"),
+    )]
+    return "sha256:" + hashlib.sha256(json.dumps(content, ensure_ascii=False).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class SeenManifest:
+    """
+    Messages that earlier incremental runs have already cleaned, keyed by
+    message_key, plus the settings those runs used.
+
+    Stored as SQLite next to the pipeline outputs.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, added TEXT NOT NULL)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.conn.commit()
+
+    def keys(self) -> Set[str]:
+        return {key for (key,) in self.conn.execute("SELECT key FROM seen")}
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        added = datetime.now(timezone.utc).isoformat()
+        self.conn.executemany("INSERT OR IGNORE INTO seen (key, added) VALUES (?, ?)", ((k, added) for k in keys))
+        self.conn.commit()
+
+    def get(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, name: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+        self.conn.commit()
+
+    def reset(self) -> None:
+        self.conn.execute("DELETE FROM seen")
+        self.conn.execute("DELETE FROM meta")
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _tee_records(records: Iterable[Dict[str, Any]], path: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """Pass records through unchanged, also writing them to `path` if given."""
+    if path is None:
+        yield from records
+        return
+    with open_record_writer(path) as writer:
+        for rec in records:
+            writer.write(rec)
+            yield rec
+
+
+def run_fused_pipeline(
+    input_path: str,
+    sender_email: Optional[str] = None,
+    output_dir: str = ".",
+    per_topic: int = 200,
+    quiet: bool = False,
+    workers: int = 1,
+    keep_intermediates: bool = False,
+    compress: bool = False
+) -> Dict[str, Any]:
+    """
+    Run import -> convert -> clean -> curate as one streaming pass.
+
+    Records flow through generators from the MBOX (or JSON) input straight
+    into curation, so the corpus is never serialized between stages. Only
+    each topic's current top picks are held in memory.
+
+    Since every stage runs at once, a process pool per stage would start
+    about 3 x workers processes. Only the clean stage, which dominates the
+    cost and loads a PII model per process, gets the worker pool; import
+    and MinHash dedupe run in this process.
+
+    Args:
+        workers: Processes for the clean stage
+        keep_intermediates: Also write emails_raw.json, emails.jsonl and
+            cleaned_emails.jsonl as records pass through (for debugging, or
+            so a later non-fused run can resume from them)
+
+    See run_pipeline for the remaining arguments.
+
+    Returns:
+        Combined statistics from all stages, shaped like run_pipeline's
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def intermediate(name: str) -> Optional[str]:
+        return str(output_dir / name) if keep_intermediates else None
+
+    results: Dict[str, Any] = {}
+    shortlist_path = str(output_dir / "style_shortlist.csv")
+
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"⚡ FUSED PIPELINE: import → convert → clean → curate")
+        print(f"{'='*60}")
+
+    # Stage 0: Import (streamed)
+    if needs_mbox_import(input_path):
+        mbox_files = find_mbox_files(input_path, quiet=quiet)
+        if not mbox_files:
+            if not quiet:
+                _print_takeout_instructions()
+            return results
+        import_stats: Dict[str, Any] = {"files": len(mbox_files)}
+        records = iter_import(mbox_files, import_stats, 1, quiet, sender_email)
+        records = _tee_records(records, intermediate("emails_raw.json"))
+        results["import"] = import_stats
+    else:
+        records = iter_records(input_path)
+
+    # Stage 1: Convert
+    convert_stats: Dict[str, Any] = {}
+    records = iter_converted(records, convert_stats, quiet=True)
+    records = _tee_records(records, intermediate("emails.jsonl"))
+    results["convert"] = convert_stats
+
+    # Stage 2: Clean & Anonymize
+    if not quiet:
+        print(f"   🔒 Loading PII detection engine ({_pii_model})...")
+    _ = get_analyzer()
+    clean_stats: Dict[str, Any] = {}
+    records = iter_cleaned(records, clean_stats, sender_email, quiet=quiet, workers=workers)
+    records = _tee_records(records, intermediate(cleaned_filename(compress)))
+    results["clean"] = clean_stats
+
+    # Stage 3: Curate (pulls everything above through)
+    results["curate"] = curate_records(records, shortlist_path, per_topic, quiet=quiet,
+                                       dedupe_index=str(output_dir / DEDUPE_INDEX_FILENAME))
+    close_pii_cache()
+
+    if keep_intermediates:
+        # Manifests let a later non-fused run resume from the kept files
+        convert_input = input_path
+        if "import" in results:
+            convert_input = intermediate("emails_raw.json")
+            write_stage_manifest("import", input_path, convert_input, import_params(sender_email),
+                                 import_stats["imported"])
+        write_stage_manifest("convert", convert_input, intermediate("emails.jsonl"), convert_params(),
+                             convert_stats["kept"])
+        write_stage_manifest("clean", intermediate("emails.jsonl"), intermediate(cleaned_filename(compress)),
+                             clean_params(sender_email), clean_stats["kept"])
+        write_stage_manifest("curate", intermediate(cleaned_filename(compress)), shortlist_path,
+                             curate_params(per_topic), results["curate"]["shortlisted"])
+
+    if not quiet:
+        _print_clean_summary(clean_stats)
+        print(f"\n{'='*60}")
+        print(f"🎉 PIPELINE COMPLETE!")
+        print(f"{'='*60}")
+        print(f"\n   📁 Output: {shortlist_path}")
+        if keep_intermediates:
+            print(f"      (intermediate files kept in {output_dir}/)")
+        print(f"\n   📊 Final count: {results['curate']['shortlisted']:,} style samples ready!\n")
+
+    return results
+
+
+def run_incremental_pipeline(
+    input_path: str,
+    sender_email: Optional[str] = None,
+    output_dir: str = ".",
+    per_topic: int = 200,
+    quiet: bool = False,
+    workers: int = 1,
+    compress: bool = False,
+    cluster_other: int = 0
+) -> Dict[str, Any]:
+    """
+    Run the pipeline over only the messages earlier runs haven't seen.
+
+    Message keys (see message_key) are kept in seen_messages.sqlite3 in
+    output_dir. Messages with a known Message-ID are dropped during import
+    before MIME parsing; the rest are checked after conversion. New messages
+    are cleaned and appended to the existing cleaned_emails.jsonl, and the
+    shortlist is rebuilt from the merged set. Changing --sender starts the
+    manifest over, since earlier runs filtered with the old value.
+
+    Import and convert stream straight into cleaning (no emails_raw.json or
+    emails.jsonl is written).
+
+    See run_pipeline for the arguments.
+
+    Returns:
+        Combined statistics, shaped like run_pipeline's plus an
+        "incremental" entry (new, already_seen, previous)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results: Dict[str, Any] = {}
+    cleaned_path = str(output_dir / cleaned_filename(compress))
+    shortlist_path = str(output_dir / "style_shortlist.csv")
+
+    manifest = SeenManifest(str(output_dir / "seen_messages.sqlite3"))
+    settings = json.dumps({"sender": (sender_email or "").lower()})
+    if manifest.get("settings") not in (None, settings):
+        if not quiet:
+            print(f"\n⚠️  Sender changed since the last incremental run - starting over")
+        manifest.reset()
+    seen = manifest.keys()
+    has_previous = bool(seen) and os.path.exists(cleaned_path)
+    if not has_previous:
+        seen = set()
+
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"🔁 INCREMENTAL PIPELINE: {len(seen):,} messages already processed")
+        print(f"{'='*60}")
+
+    # Stage 0: Import (streamed), skipping known Message-IDs before parsing
+    if needs_mbox_import(input_path):
+        mbox_files = find_mbox_files(input_path, quiet=quiet)
+        if not mbox_files:
+            if not quiet:
+                _print_takeout_instructions()
+            manifest.close()
+            return results
+        import_stats: Dict[str, Any] = {"files": len(mbox_files)}
+        records = iter_import(mbox_files, import_stats, workers, quiet, sender_email, skip_message_ids=seen)
+        results["import"] = import_stats
+    else:
+        records = iter_records(input_path)
+
+    # Stage 1: Convert
+    convert_stats: Dict[str, Any] = {}
+    records = iter_converted(records, convert_stats, quiet=True)
+    results["convert"] = convert_stats
+
+    # Keep only messages no earlier run (or earlier record in this run) has seen
+    incremental = {"new": 0, "already_seen": 0, "previous": 0}
+    new_keys: List[str] = []
+
+    def only_new(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for rec in records:
+            key = message_key(rec)
+            if key in seen:
+                incremental["already_seen"] += 1
+                continue
+            seen.add(key)
+            new_keys.append(key)
+            incremental["new"] += 1
+            yield rec
+
+    # Stage 2: Clean the new messages, appended after the previous results
+    if not quiet:
+        print(f"   🔒 Loading PII detection engine ({_pii_model})...")
+    _ = get_analyzer()
+    clean_stats: Dict[str, Any] = {}
+    records = iter_cleaned(only_new(records), clean_stats, sender_email, quiet=quiet, workers=workers)
+
+    # Append in place; if the run fails, cut the file back to the previous
+    # results so the seen-message manifest and the output stay in step
+    previous_size = 0
+    if has_previous:
+        previous_size = os.path.getsize(cleaned_path)
+        with open_records_file(cleaned_path, "rb") as f:
+            incremental["previous"] = sum(1 for line in f if line.strip())
+    try:
+        with RecordWriter(cleaned_path, resume=(previous_size, 0) if has_previous else None) as writer:
+            for rec in records:
+                writer.write(rec)
+    except BaseException:
+        if has_previous:
+            with open(cleaned_path, "r+b") as f:
+                f.truncate(previous_size)
+        raise
+    close_pii_cache()
+    clean_stats["output"] = cleaned_path
+    results["clean"] = clean_stats
+
+    manifest.add_many(new_keys)
+    manifest.set("settings", settings)
+    manifest.close()
+    if "import" in results:
+        incremental["already_seen"] += results["import"]["already_seen"]
+    results["incremental"] = incremental
+
+    if not quiet:
+        _print_clean_summary(clean_stats)
+        print(f"\n   🔁 {incremental['new']:,} new messages, {incremental['already_seen']:,} already processed, "
+              f"{incremental['previous']:,} cleaned emails carried over")
+
+    if incremental["previous"] + clean_stats["kept"] == 0:
+        if not quiet:
+            print(f"\n❌ No emails passed cleaning filters!")
+            print(f"   Check your --sender email address or date range.")
+        return results
+
+    # Stage 3: Curate over previous + new cleaned emails
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"⭐ STAGE 3: QUALITY CURATION")
+        print(f"{'='*60}")
+    results["curate"] = build_shortlist(cleaned_path, shortlist_path, per_topic, quiet=quiet, workers=workers,
+                                        cluster_other=cluster_other)
+
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"🎉 PIPELINE COMPLETE!")
+        print(f"{'='*60}")
+        print(f"\n   📁 Output: {shortlist_path}")
+        print(f"\n   📊 Final count: {results['curate']['shortlisted']:,} style samples ready!\n")
+
+    return results
+
+
 def run_pipeline(
     input_path: str,
     sender_email: Optional[str] = None,
     output_dir: str = ".",
     per_topic: int = 200,
     quiet: bool = False,
-    fresh: bool = False
+    fresh: bool = False,
+    workers: int = 1,
+    compress: bool = False,
+    columnar: bool = False,
+    cluster_other: int = 0
 ) -> Dict[str, Any]:
     """
     Run the full pipeline: import (if mbox/zip/dir) -> convert -> clean -> curate.
 
-    Supports graceful restart - skips stages if output files already exist.
-    Use fresh=True to force re-running all stages.
+    Supports graceful restart - each stage writes a manifest next to its
+    output (input fingerprint, parameters, record count), and a stage is
+    skipped only if its output is intact and was built from the same input
+    with the same parameters. Use fresh=True to force re-running all stages.
 
     Args:
         input_path: Path to MBOX file, directory, zip file, or JSON file
@@ -1106,7 +4389,13 @@ def run_pipeline(
         output_dir: Directory for output files
         per_topic: Max emails per topic in shortlist
         quiet: If True, suppress progress output
-        fresh: If True, ignore existing files and re-run everything
+        fresh: If True, ignore existing outputs and re-run everything
+        workers: Number of processes for the import, clean and dedupe stages
+        compress: If True, write the cleaned emails gzip-compressed
+        columnar: If True, write the imported, converted and cleaned emails
+            as column stores (.cols), so filters only read the fields they need
+        cluster_other: Split the "other" topic into this many TF-IDF
+            clusters (0 = off; see build_shortlist)
 
     Returns:
         Combined statistics from all stages
@@ -1120,25 +4409,40 @@ def run_pipeline(
     # Define output paths
     raw_json_path = str(output_dir / "emails_raw.json")
     jsonl_path = str(output_dir / "emails.jsonl")
-    cleaned_path = str(output_dir / "cleaned_emails.json")
+    cleaned_path = str(output_dir / cleaned_filename(compress))
+    if columnar:
+        raw_json_path = str(output_dir / ("emails_raw" + COLUMN_STORE_SUFFIX))
+        jsonl_path = str(output_dir / ("emails" + COLUMN_STORE_SUFFIX))
+        cleaned_path = str(output_dir / ("cleaned_emails" + COLUMN_STORE_SUFFIX))
     shortlist_path = str(output_dir / "style_shortlist.csv")
 
+    def up_to_date(stage: str, stage_input: str, output: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if fresh:
+            return None
+        manifest = check_stage_manifest(stage, stage_input, output, params)
+        if manifest is None and os.path.exists(output) and not quiet:
+            print(f"\n♻️  {os.path.basename(output)} is stale or incomplete - rebuilding")
+        return manifest
+
+    def print_skip(stage: str, output: str, manifest: Dict[str, Any]) -> None:
+        if not quiet:
+            print(f"\n⏭️  SKIPPING {stage} ({os.path.basename(output)} is up to date, "
+                  f"{manifest['records']:,} records)")
+
     # Stage 0: Import MBOX (if needed)
     if needs_mbox_import(input_path):
         json_path = raw_json_path
 
-        if not fresh and os.path.exists(json_path):
+        manifest = up_to_date("import", input_path, json_path, import_params(sender_email))
+        if manifest:
+            print_skip("IMPORT", json_path, manifest)
             if not quiet:
-                size_mb = os.path.getsize(json_path) / (1024 * 1024)
-                print(f"\n⏭️  SKIPPING IMPORT (found existing emails_raw.json, {size_mb:.1f} MB)")
                 print(f"   Use --fresh to re-import from source")
-            # Load stats from existing file
-            with open(json_path, "r") as f:
-                data = json.load(f)
-                count = len(data) if isinstance(data, list) else 1
+            count = manifest["records"]
             results["import"] = {"total": count, "imported": count, "skipped": 0, "output": json_path, "resumed": True}
         else:
-            results["import"] = import_mbox(input_path, json_path, quiet=quiet)
+            results["import"] = import_mbox(input_path, json_path, quiet=quiet, workers=workers,
+                                            sender_email=sender_email)
 
             # Check if any emails were imported
             if results["import"]["imported"] == 0:
@@ -1147,12 +4451,10 @@ def run_pipeline(
                 return results
 
     # Stage 1: Convert to JSONL
-    if not fresh and os.path.exists(jsonl_path):
-        if not quiet:
-            size_mb = os.path.getsize(jsonl_path) / (1024 * 1024)
-            print(f"\n⏭️  SKIPPING CONVERT (found existing emails.jsonl, {size_mb:.1f} MB)")
-        with open(jsonl_path, "r") as f:
-            count = sum(1 for _ in f)
+    manifest = up_to_date("convert", json_path, jsonl_path, convert_params())
+    if manifest:
+        print_skip("CONVERT", jsonl_path, manifest)
+        count = manifest["records"]
         results["convert"] = {"total": count, "kept": count, "output": jsonl_path, "resumed": True}
     else:
         if not quiet:
@@ -1162,19 +4464,18 @@ def run_pipeline(
         results["convert"] = convert_to_jsonl(json_path, jsonl_path, quiet=quiet)
 
     # Stage 2: Clean & Anonymize
-    if not fresh and os.path.exists(cleaned_path):
-        if not quiet:
-            size_mb = os.path.getsize(cleaned_path) / (1024 * 1024)
-            print(f"\n⏭️  SKIPPING CLEAN (found existing cleaned_emails.json, {size_mb:.1f} MB)")
-        with open(cleaned_path, "r") as f:
-            data = json.load(f)
-        results["clean"] = {"total": len(data), "kept": len(data), "output": cleaned_path, "resumed": True}
+    manifest = up_to_date("clean", jsonl_path, cleaned_path, clean_params(sender_email))
+    if manifest:
+        print_skip("CLEAN", cleaned_path, manifest)
+        count = manifest["records"]
+        results["clean"] = {"total": count, "kept": count, "output": cleaned_path, "resumed": True}
     else:
         if not quiet:
             print(f"\n{'='*60}")
             print(f"🔒 STAGE 2: CLEANING & PII ANONYMIZATION")
             print(f"{'='*60}")
-        results["clean"] = clean_emails(jsonl_path, cleaned_path, sender_email, quiet=quiet)
+        results["clean"] = clean_emails(jsonl_path, cleaned_path, sender_email, quiet=quiet, workers=workers,
+                                        resume=not fresh)
 
         # Check if any emails passed cleaning
         if results["clean"]["kept"] == 0:
@@ -1184,28 +4485,27 @@ def run_pipeline(
             return results
 
     # Stage 3: Curate Shortlist
-    if not fresh and os.path.exists(shortlist_path):
-        if not quiet:
-            size_kb = os.path.getsize(shortlist_path) / 1024
-            print(f"\n⏭️  SKIPPING CURATE (found existing style_shortlist.csv, {size_kb:.1f} KB)")
-        with open(shortlist_path, "r") as f:
-            count = sum(1 for _ in f) - 1  # minus header
-        results["curate"] = {"total_input": results["clean"]["kept"], "shortlisted": count, "output": shortlist_path, "resumed": True}
+    manifest = up_to_date("curate", cleaned_path, shortlist_path, curate_params(per_topic, cluster_other=cluster_other))
+    if manifest:
+        print_skip("CURATE", shortlist_path, manifest)
+        results["curate"] = {"total_input": results["clean"]["kept"], "shortlisted": manifest["records"],
+                             "output": shortlist_path, "resumed": True}
     else:
         if not quiet:
             print(f"\n{'='*60}")
             print(f"⭐ STAGE 3: QUALITY CURATION")
             print(f"{'='*60}")
-        results["curate"] = build_shortlist(cleaned_path, shortlist_path, per_topic, quiet=quiet)
+        results["curate"] = build_shortlist(cleaned_path, shortlist_path, per_topic, quiet=quiet, workers=workers,
+                                            cluster_other=cluster_other)
 
     if not quiet:
         print(f"\n{'='*60}")
         print(f"🎉 PIPELINE COMPLETE!")
         print(f"{'='*60}")
         print(f"\n   📁 Output files in: {output_dir}/")
-        print(f"      • emails_raw.json     - Raw imported emails")
-        print(f"      • emails.jsonl        - Converted format")
-        print(f"      • cleaned_emails.json - Anonymized emails")
+        print(f"      • {os.path.basename(raw_json_path):<19} - Raw imported emails")
+        print(f"      • {os.path.basename(jsonl_path):<19} - Converted format")
+        print(f"      • {os.path.basename(cleaned_path):<19} - Anonymized emails")
         print(f"      • style_shortlist.csv - ⭐ Final curated samples")
         print(f"\n   📊 Final count: {results['curate']['shortlisted']:,} style samples ready!")
         print(f"\n   🚀 Next step: Use style_shortlist.csv for fine-tuning\n")
@@ -1230,7 +4530,7 @@ def main():
   5. Download when ready
 
 📂 SUPPORTED INPUT FORMATS:
-  • .zip file    → Extracts and finds all .mbox files
+  • .zip file    → Reads .mbox files straight from the zip (all parts of a split export)
   • directory/   → Searches recursively for .mbox files
   • .mbox file   → Processes single file directly
   • .json file   → Skips import, starts at conversion stage
@@ -1248,7 +4548,7 @@ def main():
   # Individual stages
   python pipeline.py import ./Takeout/ --out emails.json
   python pipeline.py clean emails.jsonl --sender you@gmail.com
-  python pipeline.py curate cleaned_emails.json --per-topic 100
+  python pipeline.py curate cleaned_emails.jsonl --per-topic 100
         """
     )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -1259,48 +4559,129 @@ def main():
     run_parser.add_argument("--sender", help="Filter to emails from this sender")
     run_parser.add_argument("--output-dir", default=".", help="Output directory")
     run_parser.add_argument("--per-topic", type=int, default=200, help="Max emails per topic")
+    run_parser.add_argument("--taxonomy", default=DEFAULT_TAXONOMY_PATH,
+                            help="JSON or YAML file of topic (and boring-subject) keywords")
+    run_parser.add_argument("--cluster-other", type=int, default=0, metavar="K",
+                            help="Split the \"other\" topic into K TF-IDF clusters (needs scipy; not with --fused)")
     run_parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed JSON output")
-    run_parser.add_argument("--fresh", action="store_true", help="Ignore existing files and re-run all stages")
+    run_parser.add_argument("--fresh", action="store_true", help="Ignore up-to-date stage outputs and re-run all stages")
+    run_parser.add_argument("--workers", type=int, default=1,
+                            help="Processes to use for MBOX import, cleaning and dedupe (with --fused: cleaning only)")
+    run_parser.add_argument("--fused", action="store_true",
+                            help="Stream all stages in one pass without writing intermediate files")
+    run_parser.add_argument("--incremental", action="store_true",
+                            help="Only process messages not seen by earlier --incremental runs")
+    run_parser.add_argument("--keep-intermediates", action="store_true",
+                            help="With --fused, still write emails_raw.json/emails.jsonl/cleaned_emails.jsonl")
+    run_parser.add_argument("--compress", action="store_true",
+                            help="Write cleaned emails gzip-compressed (cleaned_emails.jsonl.gz)")
+    run_parser.add_argument("--columnar", action="store_true",
+                            help="Write intermediates as column stores (.cols) so filters skip unused fields")
+    run_parser.add_argument("--no-pii-cache", action="store_true",
+                            help="Don't read or write the on-disk PII cache")
+    run_parser.add_argument("--pii-model", choices=list(PII_MODELS), default=DEFAULT_PII_MODEL,
+                            help="NER model tier for PII detection (rules = patterns only, no names)")
 
     # Import MBOX
     import_parser = subparsers.add_parser("import", help="Import MBOX/zip/directory to JSON")
     import_parser.add_argument("input", help="Input: .zip, directory, or .mbox file")
-    import_parser.add_argument("--out", help="Output JSON file")
+    import_parser.add_argument("--out", help="Output JSON file (.jsonl for one record per line, .cols for a column store)")
+    import_parser.add_argument("--sender", help="Only import emails from this sender")
+    import_parser.add_argument("--workers", type=int, default=1,
+                               help="Processes to use (splits large MBOX files across cores)")
     import_parser.add_argument("--json-stats", action="store_true", help="Output JSON stats only")
 
     # Convert JSON to JSONL
     conv_parser = subparsers.add_parser("convert", help="Convert JSON to JSONL")
-    conv_parser.add_argument("input", help="Input JSON file")
-    conv_parser.add_argument("--out", help="Output JSONL file")
+    conv_parser.add_argument("input", help="Input JSON file (or JSONL / .cols column store)")
+    conv_parser.add_argument("--out", help="Output JSONL file (.cols for a column store)")
     conv_parser.add_argument("--no-filter", action="store_true", help="Don't filter fields")
     conv_parser.add_argument("--json-stats", action="store_true", help="Output JSON stats only")
 
     # Clean and anonymize
     clean_parser = subparsers.add_parser("clean", help="Clean and anonymize emails")
-    clean_parser.add_argument("input", help="Input JSON/JSONL file")
-    clean_parser.add_argument("--out", default="cleaned_emails.json", help="Output JSON file")
+    clean_parser.add_argument("input", help="Input JSON/JSONL file or .cols column store")
+    clean_parser.add_argument("--out", default="cleaned_emails.jsonl",
+                              help="Output JSONL file (.jsonl.gz to compress, .json for a JSON array)")
     clean_parser.add_argument("--sender", help="Filter to emails from this sender")
     clean_parser.add_argument("--years", type=int, default=5, help="Keep emails from past N years")
+    clean_parser.add_argument("--batch-size", type=int, default=PII_BATCH_SIZE,
+                              help="Texts per spaCy batch during PII detection")
+    clean_parser.add_argument("--workers", type=int, default=1,
+                              help="Processes to clean with (each loads its own PII engine)")
+    clean_parser.add_argument("--no-pii-cache", action="store_true",
+                              help="Don't read or write the on-disk PII cache")
+    clean_parser.add_argument("--pii-cache-size", type=int, default=PII_CACHE_MAX_ENTRIES,
+                              help="Max entries kept in the PII cache (least recently used are evicted)")
+    clean_parser.add_argument("--pii-model", choices=list(PII_MODELS), default=DEFAULT_PII_MODEL,
+                              help="NER model tier for PII detection (rules = patterns only, no names)")
+    clean_parser.add_argument("--restart", action="store_true",
+                              help="Ignore any checkpoint from an interrupted run and start over")
     clean_parser.add_argument("--json-stats", action="store_true", help="Output JSON stats only")
 
     # Curate shortlist
     curate_parser = subparsers.add_parser("curate", help="Build style shortlist")
-    curate_parser.add_argument("input", help="Input cleaned JSON file")
+    curate_parser.add_argument("input", help="Input cleaned emails (JSONL, .jsonl.gz or JSON)")
     curate_parser.add_argument("--out", default="style_shortlist.csv", help="Output CSV file")
     curate_parser.add_argument("--per-topic", type=int, default=200, help="Max emails per topic")
+    curate_parser.add_argument("--taxonomy", default=DEFAULT_TAXONOMY_PATH,
+                               help="JSON or YAML file of topic (and boring-subject) keywords")
+    curate_parser.add_argument("--cluster-other", type=int, default=0, metavar="K",
+                               help="Split the \"other\" topic into K TF-IDF clusters (needs scipy)")
     curate_parser.add_argument("--min-chars", type=int, default=200, help="Minimum body length")
     curate_parser.add_argument("--no-dedupe", action="store_true", help="Skip deduplication")
     curate_parser.add_argument("--dedupe-threshold", type=float, default=0.8,
                                help="Similarity threshold for near-duplicate detection (0.0-1.0)")
+    curate_parser.add_argument("--workers", type=int, default=1,
+                               help="Processes to use for near-duplicate signatures")
+    curate_parser.add_argument("--no-dedupe-index", action="store_true",
+                               help="Don't keep near-duplicate signatures in dedupe_index.sqlite3 for later runs")
+    curate_parser.add_argument("--simhash", action="store_true",
+                               help="Also drop templated and short near-duplicates with a SimHash pass")
     curate_parser.add_argument("--json-stats", action="store_true", help="Output JSON stats only")
 
     detect_parser = subparsers.add_parser("detect-owner", help="Detect owner email from mbox")
     detect_parser.add_argument("input", help="Input MBOX file or directory")
 
+    bench_parser = subparsers.add_parser("benchmark-pii", help="Compare PII model tiers (recall vs speed)")
+    bench_parser.add_argument("--models", default=",".join(PII_MODELS),
+                              help="Comma-separated tiers to compare (default: all)")
+    bench_parser.add_argument("--repeat", type=int, default=20, help="Passes over the fixture for timing")
+    bench_parser.add_argument("--json-stats", action="store_true", help="Output JSON stats only")
+
     args = parser.parse_args()
 
+    if getattr(args, "pii_model", None):
+        configure_pii_model(args.pii_model)
+
+    if getattr(args, "taxonomy", None):
+        try:
+            configure_taxonomy(args.taxonomy)
+        except (OSError, ValueError) as e:
+            print(f"Error: can't load taxonomy: {e}")
+            sys.exit(1)
+
+    if getattr(args, "no_pii_cache", False):
+        configure_pii_cache(None)
+    elif getattr(args, "pii_cache_size", None):
+        configure_pii_cache(PII_CACHE_PATH, args.pii_cache_size)
+
     if args.command == "run":
-        results = run_pipeline(args.input, args.sender, args.output_dir, args.per_topic, fresh=args.fresh)
+        if args.incremental:
+            results = run_incremental_pipeline(args.input, args.sender, args.output_dir, args.per_topic,
+                                               workers=args.workers, compress=args.compress,
+                                               cluster_other=args.cluster_other)
+        elif args.fused:
+            if args.cluster_other:
+                print("Error: --cluster-other needs a second pass over the cleaned emails; drop --fused")
+                sys.exit(1)
+            results = run_fused_pipeline(args.input, args.sender, args.output_dir, args.per_topic,
+                                         workers=args.workers, keep_intermediates=args.keep_intermediates,
+                                         compress=args.compress)
+        else:
+            results = run_pipeline(args.input, args.sender, args.output_dir, args.per_topic, fresh=args.fresh,
+                                   workers=args.workers, compress=args.compress, columnar=args.columnar,
+                                   cluster_other=args.cluster_other)
 
         # Show summary table (unless pipeline failed early)
         if "curate" in results:
@@ -1324,6 +4705,7 @@ def main():
             print(f"{'Curate':<20} {curate['total_input']:>12,} {curate['shortlisted']:>12,} {curate['total_input']-curate['shortlisted']:>12,}")
 
             print(f"{'─'*60}")
+            print(f"🧠 Peak memory: {peak_rss_mb():,} MB")
 
         # Verbose: show full JSON
         if args.verbose:
@@ -1331,8 +4713,10 @@ def main():
             print(json.dumps(results, indent=2, default=str))
 
     elif args.command == "import":
-        results = import_mbox(args.input, args.out, quiet=False)
+        results = import_mbox(args.input, args.out, quiet=False, workers=args.workers,
+                              sender_email=args.sender)
         if getattr(args, 'json_stats', False):
+            results["peak_rss_mb"] = peak_rss_mb()
             print(json.dumps(results))
         elif results['imported'] > 0:
             files_msg = f" from {results['files']} files" if results.get('files', 1) > 1 else ""
@@ -1342,13 +4726,16 @@ def main():
     elif args.command == "convert":
         results = convert_to_jsonl(args.input, args.out, not args.no_filter, quiet=False)
         if getattr(args, 'json_stats', False):
+            results["peak_rss_mb"] = peak_rss_mb()
             print(json.dumps(results))
         else:
             print(f"Done. Output: {results['output']}")
 
     elif args.command == "clean":
-        results = clean_emails(args.input, args.out, args.sender, args.years, quiet=False)
+        results = clean_emails(args.input, args.out, args.sender, args.years, quiet=False,
+                               batch_size=args.batch_size, workers=args.workers, resume=not args.restart)
         if getattr(args, 'json_stats', False):
+            results["peak_rss_mb"] = peak_rss_mb()
             print(json.dumps(results))
         else:
             print(f"\nDone. Kept {results['kept']} of {results['total']} emails.")
@@ -1359,15 +4746,22 @@ def main():
             args.input, args.out, args.per_topic, args.min_chars,
             dedupe=not args.no_dedupe,
             dedupe_threshold=args.dedupe_threshold,
-            quiet=False
+            quiet=False,
+            workers=args.workers,
+            keep_dedupe_index=not args.no_dedupe_index,
+            simhash=args.simhash,
+            cluster_other=args.cluster_other
         )
         if getattr(args, 'json_stats', False):
+            results["peak_rss_mb"] = peak_rss_mb()
             print(json.dumps(results))
         else:
             print(f"\nDone. Shortlisted {results['shortlisted']} emails.")
             if "deduplication" in results:
                 d = results["deduplication"]
-                print(f"Removed {d['removed']} duplicates ({d['exact_dupes']} exact, {d['near_dupes']} near)")
+                print(f"Removed {d['removed']} duplicates ({d['exact_dupes']} exact, {d['near_dupes']} near, "
+                      f"{d['simhash_dupes']} SimHash) in {d['clusters']} clusters")
+                print(f"Clusters: {results['duplicates_output']}")
             print(f"Output: {results['output']}")
 
     elif args.command == "detect-owner":
@@ -1377,6 +4771,16 @@ def main():
         else:
             sys.exit(1)
 
+    elif args.command == "benchmark-pii":
+        models = [m.strip() for m in args.models.split(",") if m.strip()]
+        unknown = [m for m in models if m not in PII_MODELS]
+        if unknown:
+            parser.error(f"unknown model tier(s): {', '.join(unknown)}")
+        json_stats = getattr(args, 'json_stats', False)
+        results = benchmark_pii_models(models, args.repeat, quiet=json_stats)
+        if json_stats:
+            print(json.dumps(results))
+
     else:
         parser.print_help()
 
@@ -15,7 +15,7 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Button, Static, Input, Label, DataTable, ProgressBar
+from textual.widgets import Header, Footer, Button, Static, Input, Label, DataTable, ProgressBar, Select
 from textual.binding import Binding
 
 # Add script dir to path for pipeline import
@@ -23,11 +23,21 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
+from pipeline import DEFAULT_PII_MODEL  # noqa: E402
+
 # Paths
 CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "voice-synth"
 JOBS_FILE = CACHE_DIR / "jobs.json"
 VERSION = "0.4.0-alpha"
 
+# PII model tiers offered in the sender screen (see pipeline.PII_MODELS)
+PII_MODEL_LABELS = {
+    "lg": "Most accurate (large model)",
+    "md": "Balanced (medium model)",
+    "sm": "Fastest NER (small model)",
+    "rules": "Patterns only (no name detection)",
+}
+
 
 # =============================================================================
 # Job Tracking
@@ -85,15 +95,25 @@ def get_incomplete_job():
         work_dir = job.get('work_dir', '')
         if not os.path.isdir(work_dir):
             continue
-        # Check for intermediate files
+        # Check for intermediate files with an intact manifest for this sender
         if os.path.exists(os.path.join(work_dir, 'style_shortlist.csv')):
             continue
-        if any(os.path.exists(os.path.join(work_dir, f))
-               for f in ['emails_raw.json', 'emails.jsonl', 'cleaned_emails.json']):
+        if any(_stage_resumable(os.path.join(work_dir, f), job.get('sender'))
+               for f in ['emails_raw.json', 'emails.jsonl', 'cleaned_emails.jsonl']):
             return job
     return None
 
 
+def _stage_resumable(path: str, sender: Optional[str]) -> bool:
+    """True if a stage output is complete and was built for this sender."""
+    from pipeline import load_stage_manifest
+    manifest = load_stage_manifest(path)
+    if manifest is None:
+        return False
+    params = manifest.get('params', {})
+    return 'sender' not in params or params['sender'] == ((sender or '').lower() or None)
+
+
 def mark_job_complete(work_dir: str):
     """Mark jobs in work_dir as complete."""
     jobs = load_jobs()
@@ -348,6 +368,8 @@ class SenderFilterScreen(Screen):
                 Static("Filter to emails you wrote (not received)", classes="subtitle"),
                 Static("Detecting your email address...", id="detect-status", classes="help-text"),
                 Input(placeholder="Enter email address...", id="sender-input"),
+                Static("PII detection model", classes="help-text"),
+                Select(self._pii_model_options(), value=self.app.pii_model, allow_blank=False, id="pii-model"),
                 Horizontal(
                     Button("Skip (no filter)", id="btn-skip"),
                     Button("Continue", id="btn-continue", variant="primary"),
@@ -360,6 +382,14 @@ class SenderFilterScreen(Screen):
     def on_mount(self) -> None:
         self._detect_owner()
 
+    def _pii_model_options(self) -> list:
+        """Installed model tiers, always including the current default."""
+        from pipeline import pii_model_available
+        return [
+            (label, name) for name, label in PII_MODEL_LABELS.items()
+            if name == self.app.pii_model or pii_model_available(name)
+        ]
+
     @work(thread=True)
     def _detect_owner(self) -> None:
         """Try to detect owner email."""
@@ -381,6 +411,7 @@ class SenderFilterScreen(Screen):
         self.query_one("#detect-status", Static).update("Could not auto-detect email")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.app.pii_model = self.query_one("#pii-model", Select).value
         if event.button.id == "btn-skip":
             self.app.sender = ""
             self.app.work_dir = os.getcwd()
@@ -435,7 +466,7 @@ class ProgressScreen(Screen):
         try:
             from pipeline import (
                 import_mbox, convert_to_jsonl, clean_emails, build_shortlist,
-                needs_mbox_import
+                needs_mbox_import, configure_pii_model
             )
 
             results = {}
@@ -443,7 +474,8 @@ class ProgressScreen(Screen):
             # Stage 0: Import
             if needs_mbox_import(input_file):
                 self.call_from_thread(self._update_stage, "import", "running")
-                results["import"] = import_mbox(input_file, "emails_raw.json", quiet=True)
+                results["import"] = import_mbox(input_file, "emails_raw.json", quiet=True,
+                                                sender_email=sender or None)
                 self.call_from_thread(self._update_stage, "import", "complete",
                                       f"Imported {results['import'].get('imported', 0):,} emails")
                 input_file = "emails_raw.json"
@@ -458,13 +490,14 @@ class ProgressScreen(Screen):
 
             # Stage 2: Clean
             self.call_from_thread(self._update_stage, "clean", "running")
-            results["clean"] = clean_emails("emails.jsonl", "cleaned_emails.json", sender or None, quiet=True)
+            configure_pii_model(self.app.pii_model)
+            results["clean"] = clean_emails("emails.jsonl", "cleaned_emails.jsonl", sender or None, quiet=True)
             self.call_from_thread(self._update_stage, "clean", "complete",
                                   f"Cleaned {results['clean'].get('kept', 0):,} emails")
 
             # Stage 3: Curate
             self.call_from_thread(self._update_stage, "curate", "running")
-            results["curate"] = build_shortlist("cleaned_emails.json", "style_shortlist.csv", quiet=True)
+            results["curate"] = build_shortlist("cleaned_emails.jsonl", "style_shortlist.csv", quiet=True)
             self.call_from_thread(self._update_stage, "curate", "complete",
                                   f"Selected {results['curate'].get('shortlisted', 0):,} emails")
 
@@ -675,6 +708,7 @@ class VoiceSynthApp(App):
     # State
     input_file: str = ""
     sender: str = ""
+    pii_model: str = DEFAULT_PII_MODEL
     work_dir: str = ""
     results: dict = {}
     incomplete_job: Optional[dict] = None